@@ -3,9 +3,12 @@
 
 import time
 import json
+import asyncio
 import random
+import socket
 import requests
-from typing import Optional, Dict, Any, List, Callable
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, List, Callable, AsyncIterator
 
 # Circuit Breaker for fault tolerance
 class CircuitBreaker:
@@ -31,6 +34,21 @@ class CircuitBreaker:
         if c >= self.fail_threshold:
             self.open_until[key] = time.time() + self.reset_timeout
 
+    def trip(self, key: str):
+        """Open immediately, e.g. when the host does not resolve at all"""
+        self.fail_count[key] = self.fail_threshold
+        self.open_until[key] = time.time() + self.reset_timeout
+
+def _is_dns_failure(exc: BaseException) -> bool:
+    """True if a socket.gaierror sits anywhere in the exception's cause chain"""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, socket.gaierror):
+            return True
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return False
+
 # Advanced proxy manager
 class AdvancedProxyManager:
     def __init__(self):
@@ -193,6 +211,18 @@ class AdvancedScraperClient:
         self.max_retries = 3
         self.base_timeout = 30.0
         
+        # Shared connection pool so repeat hosts skip the TCP/TLS handshake.
+        # Retries stay in request() so the circuit breaker sees every failure.
+        self.http_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=0)
+        
+    def _new_session(self) -> requests.Session:
+        """Per-request session (own proxies) backed by the shared keep-alive pool"""
+        session = requests.Session()
+        session.mount('http://', self.http_adapter)
+        session.mount('https://', self.http_adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
+        
     def _jitter_delay(self, base: float, factor: float = 0.5) -> float:
         """Add jitter to delays for more natural behavior"""
         lo = base * (1.0 - factor)
@@ -209,13 +239,17 @@ class AdvancedScraperClient:
         if not self.circuit_breaker.allow(target_key):
             raise Exception(f"Circuit breaker open for {target_key}")
         
-        session = requests.Session()
+        session = self._new_session()
         attempt = 0
         last_exception = None
         
         while attempt <= self.max_retries:
             attempt += 1
             
+            # Another URL on this host may have opened the breaker meanwhile
+            if attempt > 1 and not self.circuit_breaker.allow(target_key):
+                break
+            
             try:
                 # Get proxy if available
                 proxy = self.proxy_manager.get_proxy()
@@ -272,15 +306,20 @@ class AdvancedScraperClient:
                 
             except Exception as e:
                 last_exception = e
-                self.circuit_breaker.record_failure(target_key)
                 
                 if self.logger:
                     self.logger.log_comprehensive('advanced_scraper_error',
                                                 {'url': url, 'attempt': attempt, 'error': str(e)[:200]},
                                                 e)
+                
+                # Unresolvable host: no retry will help, and neither will its other URLs
+                if _is_dns_failure(e):
+                    self.circuit_breaker.trip(target_key)
+                    break
+                self.circuit_breaker.record_failure(target_key)
             
-            # Exponential backoff with jitter
-            if attempt <= self.max_retries:
+            # Exponential backoff with jitter (pointless once the host's breaker is open)
+            if attempt <= self.max_retries and self.circuit_breaker.allow(target_key):
                 delay = self._jitter_delay(2.0 ** attempt)
                 time.sleep(min(delay, 10.0))  # Cap at 10 seconds
         
@@ -304,36 +343,58 @@ class AdvancedJobQueue:
             'kwargs': kwargs
         }
     
+    def _process_job(self, i: int, total: int, job: Dict) -> Dict:
+        """Run a single job through the client, capturing failures as results"""
+        try:
+            if self.client.logger:
+                self.client.logger.log_comprehensive('job_processing',
+                                                   {'job_number': i+1, 'total_jobs': total,
+                                                    'url': job['url']})
+            
+            result = self.client.request(
+                job['method'],
+                job['url'],
+                **job.get('kwargs', {})
+            )
+            
+            result['job_id'] = i
+            result['success'] = True
+            
+            # Rate limiting
+            time.sleep(random.uniform(0.5, 2.0))
+            
+            return result
+            
+        except Exception as e:
+            return {
+                'job_id': i,
+                'success': False,
+                'error': str(e),
+                'url': job['url']
+            }
+    
     def process_jobs(self, jobs: List[Dict]) -> List[Dict]:
-        """Process jobs sequentially (can be enhanced with threading/async)"""
-        results = []
+        """Process jobs sequentially"""
+        return [self._process_job(i, len(jobs), job) for i, job in enumerate(jobs)]
+    
+    async def iter_jobs_async(self, jobs: List[Dict]) -> AsyncIterator[Dict]:
+        """
+        Yield job results as they complete (not in job order), at most
+        max_workers in flight. Each job still goes through client.request,
+        so circuit breaker, proxy rotation and Cloudflare bypass apply unchanged.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
         
-        for i, job in enumerate(jobs):
-            try:
-                if self.client.logger:
-                    self.client.logger.log_comprehensive('job_processing',
-                                                       {'job_number': i+1, 'total_jobs': len(jobs),
-                                                        'url': job['url']})
-                
-                result = self.client.request(
-                    job['method'],
-                    job['url'],
-                    **job.get('kwargs', {})
-                )
-                
-                result['job_id'] = i
-                result['success'] = True
-                results.append(result)
-                
-                # Rate limiting
-                time.sleep(random.uniform(0.5, 2.0))
-                
-            except Exception as e:
-                results.append({
-                    'job_id': i,
-                    'success': False,
-                    'error': str(e),
-                    'url': job['url']
-                })
+        async def run(i: int, job: Dict) -> Dict:
+            async with semaphore:
+                return await asyncio.to_thread(self._process_job, i, len(jobs), job)
         
-        return results
\ No newline at end of file
+        tasks = [asyncio.create_task(run(i, job)) for i, job in enumerate(jobs)]
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    
+    async def process_jobs_async(self, jobs: List[Dict]) -> List[Dict]:
+        """Process jobs concurrently; results keep job order"""
+        results = [result async for result in self.iter_jobs_async(jobs)]
+        results.sort(key=lambda result: result['job_id'])
+        return results
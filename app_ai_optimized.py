@@ -290,8 +290,8 @@ def index():
             else:
                 # Fallback to old system
                 processed_data = {
-                    'annual_data': {str(p.fiscal_year): p.dict() for p in financial_data.periods.annual},
-                    'quarterly_data': {f"{p.fiscal_year}-{p.fiscal_quarter}": p.dict() for p in financial_data.periods.quarterly}
+                    'annual_data': {str(p.fiscal_year): p.model_dump() for p in financial_data.periods.annual},
+                    'quarterly_data': {f"{p.fiscal_year}-{p.fiscal_quarter}": p.model_dump() for p in financial_data.periods.quarterly}
                 }
                 growth_metrics = growth_calculator.calculate_all_growth_metrics(processed_data)
                 
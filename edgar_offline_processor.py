@@ -4,8 +4,10 @@ Adapted from comprehensive EDGAR toolkit for Replit compatibility
 """
 
 import os
+import csv
 import json
 import pickle
+import threading
 import requests
 # Pandas is now installed
 import pandas as pd
@@ -14,6 +16,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 import zipfile
+from collections import OrderedDict, deque
 from urllib.parse import urljoin
 
 # Set up logging
@@ -26,6 +29,14 @@ class EdgarOfflineProcessor:
     Replaces API-dependent approach with authoritative SEC filings processing
     """
     
+    # Process-wide SEC rate limit: at most 10 requests in any rolling second
+    _max_requests_per_second = 10
+    _request_times = deque(maxlen=_max_requests_per_second)
+    _throttle_lock = threading.Lock()
+    
+    # Parsed company facts kept in memory per processor (each can be tens of MB)
+    _facts_memo_size = 8
+    
     def __init__(self, data_dir="edgar_bulk_data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
@@ -45,13 +56,57 @@ class EdgarOfflineProcessor:
         
         # SEC compliance
         self.base_url = "https://www.sec.gov/Archives/"
-        self.headers = {"User-Agent": "SEC Financial Analysis Tool admin@company.com"}
+        self.headers = {
+            "User-Agent": "SEC Financial Analysis Tool admin@company.com",
+            "Accept-Encoding": "gzip, deflate"
+        }
         
         # Load cached data
         self.ticker_to_cik = self._load_ticker_cik_mapping()
+        self._facts_memo = OrderedDict()
+        self._facts_memo_lock = threading.Lock()
+    
+    def _throttle(self):
+        """Block until another SEC request fits in the shared 10 req/s budget"""
+        with self._throttle_lock:
+            now = time.monotonic()
+            if len(self._request_times) == self._max_requests_per_second:
+                wait = 1.0 - (now - self._request_times[0])
+                if wait > 0:
+                    time.sleep(wait)
+                    now = time.monotonic()
+            self._request_times.append(now)
+    
+    def _conditional_get(self, url, cache_file):
+        """
+        GET url, revalidating against the ETag stored next to cache_file.
+        Returns None when the server answers 304 Not Modified.
+        The ETag is only recorded by _save_cached_json, once the body is on disk.
+        """
+        etag_file = cache_file.with_suffix('.etag')
+        headers = self.headers
+        if cache_file.exists() and etag_file.exists():
+            etag = etag_file.read_text().strip()
+            if etag:
+                headers = {**self.headers, 'If-None-Match': etag}
         
-        # Rate limiting
-        self.request_delay = 0.1  # 10 requests per second max
+        self._throttle()
+        response = requests.get(url, headers=headers, timeout=30)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        return response
+    
+    def _save_cached_json(self, cache_file, data, response, **dump_kwargs):
+        """
+        Write data to cache_file atomically, then record the response ETag.
+        A crash in between leaves an older ETag, which only costs a full re-download.
+        """
+        tmp_file = cache_file.with_suffix(cache_file.suffix + '.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_file, cache_file)
+        cache_file.with_suffix('.etag').write_text(response.headers.get('ETag', ''))
         
     def _load_ticker_cik_mapping(self):
         """Load ticker to CIK mapping from cache"""
@@ -73,8 +128,11 @@ class EdgarOfflineProcessor:
         
         try:
             logger.info("📡 Downloading comprehensive ticker-CIK mapping from SEC...")
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
+            response = self._conditional_get(url, self.ticker_cik_cache)
+            if response is None:
+                logger.info("📊 Ticker-CIK mapping not modified, keeping cache")
+                self.ticker_to_cik = self._load_ticker_cik_mapping()
+                return self.ticker_to_cik
             
             data = response.json()
             
@@ -97,8 +155,7 @@ class EdgarOfflineProcessor:
             ticker_mapping.update(corrections)
             
             # Save to cache
-            with open(self.ticker_cik_cache, 'w') as f:
-                json.dump(ticker_mapping, f, indent=2)
+            self._save_cached_json(self.ticker_cik_cache, ticker_mapping, response, indent=2)
             
             self.ticker_to_cik = ticker_mapping
             logger.info(f"✅ Downloaded and cached {len(ticker_mapping)} ticker-CIK mappings")
@@ -136,6 +193,7 @@ class EdgarOfflineProcessor:
         
         try:
             logger.info(f"📡 Downloading index for {year} Q{quarter}...")
+            self._throttle()
             response = requests.get(url, headers=self.headers, timeout=30)
             response.raise_for_status()
             
@@ -144,7 +202,6 @@ class EdgarOfflineProcessor:
                 f.write(response.text)
             
             logger.info(f"✅ Downloaded index for {year} Q{quarter}")
-            time.sleep(self.request_delay)  # Rate limiting
             
             return self._parse_master_index(index_file)
             
@@ -152,30 +209,27 @@ class EdgarOfflineProcessor:
             logger.error(f"❌ Failed to download index for {year} Q{quarter}: {e}")
             return pd.DataFrame()
     
+    def _parse_master_index_raw(self, index_file):
+        """Yield (CIK, Company_Name, Form_Type, Date_Filed, Filename) rows from a master index file"""
+        header = 'CIK|Company Name|Form Type|Date Filed|Filename'
+        with open(index_file, 'r', encoding='utf-8', newline='') as f:
+            # Skip everything up to and including the header line
+            for line in f:
+                if header in line:
+                    break
+            else:
+                # No header found - treat the whole file as data
+                f.seek(0)
+            
+            for parts in csv.reader(f, delimiter='|', quoting=csv.QUOTE_NONE):
+                if len(parts) == 5:
+                    yield parts
+    
     def _parse_master_index(self, index_file):
         """Parse SEC master index file into DataFrame"""
         try:
-            with open(index_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            lines = content.split('\n')
-            
-            # Find data start (after header)
-            data_start = 0
-            for i, line in enumerate(lines):
-                if 'CIK|Company Name|Form Type|Date Filed|Filename' in line:
-                    data_start = i + 1
-                    break
-            
-            # Parse data lines
-            data_rows = []
-            for line in lines[data_start:]:
-                if line.strip() and '|' in line:
-                    parts = line.split('|')
-                    if len(parts) == 5:
-                        data_rows.append(parts)
-            
-            df = pd.DataFrame(data_rows, columns=['CIK', 'Company_Name', 'Form_Type', 'Date_Filed', 'Filename'])
+            df = pd.DataFrame(list(self._parse_master_index_raw(index_file)),
+                              columns=['CIK', 'Company_Name', 'Form_Type', 'Date_Filed', 'Filename'])
             df['CIK'] = df['CIK'].str.zfill(10)  # Normalize CIK format
             
             return df
@@ -188,7 +242,26 @@ class EdgarOfflineProcessor:
         """
         Download and cache comprehensive company financial facts
         Downloads once per company, processes offline forever
+        Recently used tickers are served from memory without re-reading the cache file
         """
+        if not force_refresh:
+            with self._facts_memo_lock:
+                facts = self._facts_memo.get(ticker)
+                if facts is not None:
+                    self._facts_memo.move_to_end(ticker)
+                    return facts
+        
+        facts = self._load_company_facts(ticker, force_refresh)
+        if facts is not None:
+            with self._facts_memo_lock:
+                self._facts_memo[ticker] = facts
+                self._facts_memo.move_to_end(ticker)
+                if len(self._facts_memo) > self._facts_memo_size:
+                    self._facts_memo.popitem(last=False)
+        return facts
+    
+    def _load_company_facts(self, ticker, force_refresh):
+        """Read company facts from the on-disk cache, downloading them when missing or forced"""
         company_info = self.get_company_info(ticker)
         if not company_info:
             logger.error(f"❌ Company info not found for ticker {ticker}")
@@ -206,17 +279,18 @@ class EdgarOfflineProcessor:
         
         try:
             logger.info(f"📡 Downloading company facts for {ticker} (CIK: {cik})...")
-            response = requests.get(url, headers=self.headers, timeout=30)
-            response.raise_for_status()
+            response = self._conditional_get(url, facts_file)
+            if response is None:
+                logger.info(f"📊 Company facts for {ticker} not modified, using cache")
+                with open(facts_file, 'r') as f:
+                    return json.load(f)
             
             facts_data = response.json()
             
-            # Save to cache
-            with open(facts_file, 'w') as f:
-                json.dump(facts_data, f, indent=2)
+            # Save to cache (compact - machine-read only, often tens of MB)
+            self._save_cached_json(facts_file, facts_data, response, separators=(',', ':'))
             
             logger.info(f"✅ Downloaded and cached company facts for {ticker}")
-            time.sleep(self.request_delay)  # Rate limiting
             
             return facts_data
             
@@ -224,12 +298,14 @@ class EdgarOfflineProcessor:
             logger.error(f"❌ Failed to download company facts for {ticker}: {e}")
             return None
     
-    def extract_financial_metrics(self, ticker, years=5):
+    def extract_financial_metrics(self, ticker, years=5, facts=None):
         """
         Extract comprehensive financial metrics from cached company facts
         Processes data offline - NO API CALLS
+        Pass already-loaded facts to skip re-reading the cache file
         """
-        facts = self.download_company_facts(ticker)  # Uses cache if available
+        if facts is None:
+            facts = self.download_company_facts(ticker)  # Uses cache if available
         if not facts:
             logger.warning(f"⚠️ No facts data available for {ticker}")
             return None
@@ -250,34 +326,38 @@ class EdgarOfflineProcessor:
         
         us_gaap = facts.get('facts', {}).get('us-gaap', {})
         
+        def _extract_one(metric):
+            """Split one metric's USD values into annual and quarterly records"""
+            annual, quarterly = [], []
+            values = us_gaap.get(metric, {}).get('units', {}).get('USD', [])
+            
+            # Separate annual vs quarterly data
+            for value in values:
+                form_type = value.get('form', '')
+                end_date = value.get('end', '')
+                filed_date = value.get('filed', '')
+                amount = value.get('val', 0)
+                
+                record = {
+                    'metric': metric,
+                    'value': amount,
+                    'end_date': end_date,
+                    'form_type': form_type,
+                    'filed_date': filed_date
+                }
+                
+                if form_type in ['10-K', '10-K/A']:
+                    annual.append(record)
+                elif form_type in ['10-Q', '10-Q/A']:
+                    quarterly.append(record)
+            
+            return annual, quarterly
+        
         # Process each metric
         for metric in target_metrics:
-            if metric in us_gaap:
-                metric_data = us_gaap[metric]
-                units = metric_data.get('units', {})
-                
-                if 'USD' in units:
-                    values = units['USD']
-                    
-                    # Separate annual vs quarterly data
-                    for value in values:
-                        form_type = value.get('form', '')
-                        end_date = value.get('end', '')
-                        filed_date = value.get('filed', '')
-                        amount = value.get('val', 0)
-                        
-                        record = {
-                            'metric': metric,
-                            'value': amount,
-                            'end_date': end_date,
-                            'form_type': form_type,
-                            'filed_date': filed_date
-                        }
-                        
-                        if form_type in ['10-K', '10-K/A']:
-                            extracted_data['annual_data'].append(record)
-                        elif form_type in ['10-Q', '10-Q/A']:
-                            extracted_data['quarterly_data'].append(record)
+            annual, quarterly = _extract_one(metric)
+            extracted_data['annual_data'].extend(annual)
+            extracted_data['quarterly_data'].extend(quarterly)
         
         # Calculate data quality
         total_expected = len(target_metrics) * years
@@ -323,7 +403,6 @@ class EdgarOfflineProcessor:
             logger.info(f"📊 Downloading facts for {len(tickers)} tickers...")
             for ticker in tickers:
                 self.download_company_facts(ticker, force_refresh=force_refresh)
-                time.sleep(self.request_delay)  # Rate limiting
         
         logger.info("✅ Offline data initialization complete")
         return self.get_storage_stats()
\ No newline at end of file
@@ -31,10 +31,17 @@ class EnhancedDataProcessor(FinancialDataProcessor):
         
         # Merge industry-specific mappings
         self.fact_mappings.update(self.industry_specific_mappings)
+        
+        # Pre-built alias sets so missing-data checks are a single set operation
+        self._fact_mapping_sets = {
+            metric: frozenset(fact_names)
+            for metric, fact_names in self.fact_mappings.items()
+        }
     
     def analyze_missing_data(self, raw_data: Dict[str, Any]) -> Dict[str, List[str]]:
         """Analyze what data is missing and suggest potential sources"""
         facts = raw_data.get('facts', {}).get('us-gaap', {})
+        facts_keys = facts.keys()
         
         missing_analysis = {
             'missing_core_metrics': [],
@@ -46,22 +53,15 @@ class EnhancedDataProcessor(FinancialDataProcessor):
         # Check core metrics
         core_metrics = ['revenue', 'net_income', 'operating_income', 'eps']
         for metric in core_metrics:
-            found = False
-            for fact_name in self.fact_mappings[metric]:
-                if fact_name in facts:
-                    found = True
-                    break
-            if not found:
+            if facts_keys.isdisjoint(self._fact_mapping_sets[metric]):
                 missing_analysis['missing_core_metrics'].append(metric)
         
         # Check for industry-specific metrics
         industry_metrics = ['payment_volume', 'processing_fees', 'transaction_count']
         for metric in industry_metrics:
-            if metric in self.fact_mappings:
-                for fact_name in self.fact_mappings[metric]:
-                    if fact_name in facts:
-                        missing_analysis['industry_specific_available'].append(metric)
-                        break
+            if metric in self._fact_mapping_sets:
+                if not facts_keys.isdisjoint(self._fact_mapping_sets[metric]):
+                    missing_analysis['industry_specific_available'].append(metric)
         
         return missing_analysis
     
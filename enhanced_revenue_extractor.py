@@ -58,21 +58,23 @@ class EnhancedRevenueExtractor:
             processed_quarterly = set()
             
             for entry in revenue_entries:
-                frame = entry.get('frame')
-                if frame:  # Skip framed entries (contextual/cumulative)
+                if entry.get('frame') is not None:  # Skip framed entries (contextual/cumulative)
                     continue
-                    
-                fiscal_period = entry.get('fp')
-                fiscal_year = entry.get('fy')
-                value = entry.get('val')
-                end_date = entry.get('end')
                 
-                if not all([fiscal_period, fiscal_year, value, end_date]):
+                try:
+                    fiscal_period, fiscal_year, value, end_date = (
+                        entry['fp'], entry['fy'], entry['val'], entry['end']
+                    )
+                except KeyError:
+                    continue
+                
+                # SEC nulls still disqualify an entry; a reported value of 0 does not
+                if fiscal_year is None or value is None or end_date is None:
                     continue
                 
                 # Annual data (FY periods)
                 if fiscal_period == 'FY':
-                    period_key = f"{fiscal_year}-FY-{end_date}"
+                    period_key = (fiscal_year, 'FY', end_date)
                     if period_key not in processed_annual:
                         annual_revenue.append({
                             'fiscal_year': fiscal_year,
@@ -84,7 +86,7 @@ class EnhancedRevenueExtractor:
                 
                 # Quarterly data (Q1, Q2, Q3, Q4 periods)  
                 elif fiscal_period in ['Q1', 'Q2', 'Q3', 'Q4']:
-                    period_key = f"{fiscal_year}-{fiscal_period}-{end_date}"
+                    period_key = (fiscal_year, fiscal_period, end_date)
                     if period_key not in processed_quarterly:
                         quarterly_revenue.append({
                             'fiscal_year': fiscal_year,
@@ -4,15 +4,226 @@ Designed for Replit environment constraints and debugging needs
 """
 
 import logging
+import logging.handlers
+import atexit
+import io
+import queue
+import threading
 import traceback
+import weakref
 import time
 import json
+from collections import Counter, deque
+from itertools import count, islice
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from enum import Enum
 import sys
 import os
 
+# Cap on error records kept in memory for a long-running process
+MAX_SESSION_ERRORS = 10_000
+
+# Seconds during which repeats of an aggregated error are counted, not logged
+AGGREGATION_WINDOW = 1.0
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class _LazyTrace:
+    """Stack or exception trace captured at log time, formatted to text only when serialized"""
+    
+    __slots__ = ("_source", "_formatted")
+    
+    def __init__(self, source):
+        # source is a StackSummary or TracebackException; neither keeps frames alive
+        self._source = source
+        self._formatted = None
+    
+    @classmethod
+    def from_frame(cls, frame) -> "_LazyTrace":
+        # lookup_lines=False defers source reads until formatting
+        summary = traceback.StackSummary.extract(traceback.walk_stack(frame), lookup_lines=False)
+        summary.reverse()
+        return cls(summary)
+    
+    @classmethod
+    def from_exception(cls, exception: BaseException) -> "_LazyTrace":
+        return cls(traceback.TracebackException.from_exception(exception, lookup_lines=False))
+    
+    def format(self) -> List[str]:
+        if self._formatted is None:
+            self._formatted = list(self._source.format())
+        return self._formatted
+    
+    def __str__(self) -> str:
+        return "".join(self.format())
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, _LazyTrace):
+        return obj.format()
+    return str(obj)
+
+
+def _dumps(obj: Any) -> str:
+    """Compact JSON encoding for log lines, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=_json_default)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Compact JSON encoding straight to bytes, for file output"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode()
+
+_LEVEL_MAP = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+}
+
+class _BufferedConsoleHandler(logging.StreamHandler):
+    """StreamHandler that batches writes, flushing on a timer and on CRITICAL records"""
+    
+    def __init__(self, stream, flush_interval: float = 0.25):
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+    
+    def _flush_periodically(self):
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.CRITICAL:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        # Push out pending print() output first so batched log lines land after it
+        if self.stream is not sys.stdout:
+            try:
+                sys.stdout.flush()
+            except (AttributeError, ValueError):
+                pass
+        try:
+            super().flush()
+        except ValueError:
+            pass  # Underlying stdout already closed (e.g. by the host at shutdown)
+    
+    def close(self):
+        self._stop_flushing.set()
+        self.flush()
+        super().close()
+
+
+class _DetailedConsoleFormatter(logging.Formatter):
+    """
+    Same layout as the detailed '%(asctime)s | %(name)s | ... | %(message)s' format,
+    built with one f-string and a timestamp prefix cached per second
+    """
+    
+    def __init__(self):
+        super().__init__('%(message)s')
+        self._cached_second = None
+        self._cached_stamp = ""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_stamp = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_second = second
+        message = (f"{self._cached_stamp},{int(record.msecs):03d} | {record.name} | {record.levelname} | "
+                   f"{record.filename}:{record.lineno} | {record.funcName}() | {record.getMessage()}")
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+        if record.stack_info:
+            message = f"{message}\n{self.formatStack(record.stack_info)}"
+        return message
+
+
+class _StdoutWrapper(io.TextIOWrapper):
+    """TextIOWrapper over sys.stdout.buffer whose close() flushes and detaches instead of closing it"""
+    
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            # Detach both layers so neither closing nor collecting them closes sys.stdout.buffer
+            self.detach().detach()
+
+
+def _buffered_stdout(buffer_size: int = 65536):
+    """Wrap stdout in a 64KB buffer; fall back to sys.stdout if it has no binary layer"""
+    raw = getattr(sys.stdout, "buffer", None)
+    if raw is None:
+        return sys.stdout
+    return _StdoutWrapper(
+        io.BufferedWriter(raw, buffer_size=buffer_size),
+        encoding=sys.stdout.encoding,
+        errors="replace",
+        line_buffering=False,
+        write_through=False,
+    )
+
+
+# One buffered console writer and listener thread shared by every logger instance
+_console_queue_handler = None
+_console_listener = None
+_console_lock = threading.Lock()
+
+# Logger instances whose open aggregation windows are summarized at exit
+_live_loggers = weakref.WeakSet()
+
+
+def _flush_all_aggregates():
+    for instance in list(_live_loggers):
+        instance._flush_aggregates(float("inf"))
+
+
+def _shared_console_handler() -> logging.handlers.QueueHandler:
+    """Return the process-wide QueueHandler, starting its listener on first use"""
+    global _console_queue_handler, _console_listener
+    with _console_lock:
+        if _console_queue_handler is None:
+            console_handler = _BufferedConsoleHandler(_buffered_stdout())
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(_DetailedConsoleFormatter())
+            
+            # Callers only enqueue records; a listener thread owns the console write
+            log_queue = queue.SimpleQueue()
+            _console_listener = logging.handlers.QueueListener(
+                log_queue, console_handler, respect_handler_level=True
+            )
+            _console_listener.start()
+            # atexit runs last-registered first: summarize open aggregation windows,
+            # drain the queue, then flush the buffer
+            atexit.register(console_handler.close)
+            atexit.register(_console_listener.stop)
+            atexit.register(_flush_all_aggregates)
+            _console_queue_handler = logging.handlers.QueueHandler(log_queue)
+        return _console_queue_handler
+
 class ErrorLevel(Enum):
     """Error severity levels with specific meanings"""
     CRITICAL = "CRITICAL"  # App cannot continue
@@ -44,6 +255,19 @@ class SECFinancialErrorLogger:
     Designed specifically for SEC financial data analysis debugging
     """
     
+    __slots__ = (
+        "app_name", "session_id",
+        "main_logger", "network_logger", "data_logger", "user_logger",
+        "detailed_formatter", "standard_formatter",
+        "_log_queue", "_listener", "_logger_by_category",
+        "error_counts", "session_errors", "_total_errors", "_record_seq", "_timeout_count",
+        "_recent_errors", "_recent_message_counts", "_recent_critical",
+        "_aggregates", "_aggregate_lock",
+        "request_times", "api_call_times",
+        "environment_info", "_env_json",
+        "__weakref__",
+    )
+    
     def __init__(self, app_name: str = "SEC_Financial_Analysis"):
         self.app_name = app_name
         self.session_id = f"{app_name}_{int(time.time())}"
@@ -53,7 +277,19 @@ class SECFinancialErrorLogger:
         
         # Error tracking for analysis
         self.error_counts = {category.value: 0 for category in ErrorCategory}
-        self.session_errors = []
+        self.session_errors = deque(maxlen=MAX_SESSION_ERRORS)
+        self._total_errors = 0
+        self._record_seq = count()  # Error ID suffix; summaries get IDs but are not counted
+        self._timeout_count = 0
+        
+        # Rolling window of recent (message, level) pairs for trend analysis
+        self._recent_errors = deque(maxlen=10)
+        self._recent_message_counts = Counter()
+        self._recent_critical = 0
+        
+        # Open aggregation windows, oldest first: key -> first record, latest repeat + count
+        self._aggregates = {}
+        self._aggregate_lock = threading.Lock()
         
         # Performance tracking
         self.request_times = []
@@ -61,6 +297,10 @@ class SECFinancialErrorLogger:
         
         # Environment info for debugging
         self.environment_info = self._get_environment_info()
+        self._env_json = _dumps(self.environment_info)
+        
+        # Open aggregation windows are summarized at exit, before the console drains
+        _live_loggers.add(self)
         
     def setup_loggers(self):
         """Setup multiple specialized loggers"""
@@ -82,22 +322,29 @@ class SECFinancialErrorLogger:
         self.user_logger.setLevel(logging.INFO)
         
         # Create formatters for different detail levels
-        self.detailed_formatter = logging.Formatter(
-            '%(asctime)s | %(name)s | %(levelname)s | %(filename)s:%(lineno)d | %(funcName)s() | %(message)s'
-        )
+        self.detailed_formatter = _DetailedConsoleFormatter()
         
         self.standard_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)s | %(message)s'
         )
         
-        # Setup console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(self.detailed_formatter)
+        # Console output goes through the shared buffered handler and listener
+        queue_handler = _shared_console_handler()
+        self._log_queue = queue_handler.queue
+        self._listener = _console_listener
         
-        # Add handlers to all loggers
+        # Add the handler once; loggers are shared between instances with the same app_name
         for logger in [self.main_logger, self.network_logger, self.data_logger, self.user_logger]:
-            logger.addHandler(console_handler)
+            if queue_handler not in logger.handlers:
+                logger.addHandler(queue_handler)
+        
+        # Category routing; anything unlisted goes to the main logger
+        self._logger_by_category = {
+            ErrorCategory.NETWORK: self.network_logger,
+            ErrorCategory.SEC_API: self.network_logger,
+            ErrorCategory.DATA_PROCESSING: self.data_logger,
+            ErrorCategory.USER_INPUT: self.user_logger,
+        }
     
     def _get_environment_info(self) -> Dict[str, Any]:
         """Collect environment information for debugging"""
@@ -121,14 +368,49 @@ class SECFinancialErrorLogger:
                   detail_level: DetailLevel = DetailLevel.STANDARD,
                   context: Optional[Dict[str, Any]] = None,
                   exception: Optional[Exception] = None,
-                  request_data: Optional[Dict[str, Any]] = None) -> str:
+                  request_data: Optional[Dict[str, Any]] = None,
+                  aggregate_key: Optional[tuple] = None) -> str:
         """
         Primary error logging method with comprehensive detail levels
         
+        Errors sharing an aggregate_key within AGGREGATION_WINDOW seconds are
+        collapsed: the first is logged, repeats are counted and summarized when the
+        window closes. A repeat above the window's opening level closes it and is
+        logged immediately.
+        
         Returns: Unique error ID for tracking
         """
         
-        error_id = f"{category.value}_{int(time.time())}_{len(self.session_errors)}"
+        now = None
+        if aggregate_key is not None:
+            now = time.monotonic()
+            self._flush_aggregates(now)
+            with self._aggregate_lock:
+                window = self._aggregates.get(aggregate_key)
+                if window is not None:
+                    if _LEVEL_MAP[level.value] > _LEVEL_MAP[window["opening_level"].value]:
+                        del self._aggregates[aggregate_key]
+                    else:
+                        window["count"] += 1
+                        window["message"] = message
+                        window["level"] = level
+                        window["last_context"] = context
+                        self._total_errors += 1
+                        self.error_counts[category.value] += 1
+                        return window["error_id"]
+            if window is not None:
+                self._summarize_aggregate(window)
+        
+        return self._log_record(message, category, level, detail_level, context,
+                                exception, request_data, aggregate_key, now)
+    
+    def _log_record(self, message: str, category: ErrorCategory, level: ErrorLevel,
+                    detail_level: DetailLevel, context: Optional[Dict[str, Any]],
+                    exception: Optional[Exception], request_data: Optional[Dict[str, Any]],
+                    aggregate_key: Optional[tuple] = None, now: Optional[float] = None,
+                    counted: bool = True) -> str:
+        """Build, store and emit one error record; aggregate summaries pass counted=False"""
+        error_id = f"{category.value}_{int(time.time())}_{next(self._record_seq)}"
         timestamp = datetime.now().isoformat()
         
         # Build error record
@@ -151,39 +433,93 @@ class SECFinancialErrorLogger:
             
         if detail_level.value >= DetailLevel.FORENSIC.value:
             error_record["environment"] = self.environment_info
-            error_record["stack_trace"] = traceback.format_stack()
+            error_record["stack_trace"] = _LazyTrace.from_frame(sys._getframe(2))
             
         if exception:
             error_record["exception"] = {
                 "type": type(exception).__name__,
                 "message": str(exception),
-                "traceback": traceback.format_exception(type(exception), exception, exception.__traceback__)
+                "traceback": _LazyTrace.from_exception(exception)
             }
         
         # Store for analysis
         self.session_errors.append(error_record)
-        self.error_counts[category.value] += 1
-        
-        # Log to appropriate logger
+        if counted:
+            self._total_errors += 1
+            self.error_counts[category.value] += 1
+        self._track_recent(message, level.value)
+        if aggregate_key is not None:
+            self._open_aggregate(aggregate_key, error_id, message, category, level, now)
+        
+        # Log to appropriate logger, skipping formatting if it would be dropped
         logger = self._get_logger_for_category(category)
-        log_method = getattr(logger, level.value.lower())
+        level_no = _LEVEL_MAP[level.value]
+        if not logger.isEnabledFor(level_no):
+            return error_id
         
         # Format message based on detail level
         formatted_message = self._format_error_message(error_record, detail_level)
-        log_method(formatted_message)
+        logger.log(level_no, formatted_message)
         
         return error_id
     
+    def _open_aggregate(self, aggregate_key: tuple, error_id: str, message: str,
+                        category: ErrorCategory, level: ErrorLevel, now: float):
+        with self._aggregate_lock:
+            self._aggregates.setdefault(aggregate_key, {
+                "error_id": error_id,
+                "message": message,
+                "category": category,
+                "level": level,
+                "opening_level": level,
+                "started": now,
+                "count": 0,
+                "last_context": None,
+            })
+    
+    def _flush_aggregates(self, now: float):
+        """Close expired aggregation windows and log a summary for any that saw repeats"""
+        expired = []
+        with self._aggregate_lock:
+            # Windows are inserted in start order, so expired ones are at the front
+            for key, window in self._aggregates.items():
+                if now - window["started"] < AGGREGATION_WINDOW:
+                    break
+                expired.append(key)
+            expired = [self._aggregates.pop(key) for key in expired]
+        
+        for window in expired:
+            self._summarize_aggregate(window)
+    
+    def _summarize_aggregate(self, window: Dict[str, Any]):
+        """Log the repeats folded into a closed window; they were already counted"""
+        if not window["count"]:
+            return
+        self._log_record(
+            f"{window['message']} - {window['count']} additional occurrence(s) within {AGGREGATION_WINDOW}s",
+            window["category"], window["level"], DetailLevel.STANDARD,
+            {"aggregated_from": window["error_id"], "occurrences": window["count"],
+             "last_context": window["last_context"]},
+            None, None, counted=False
+        )
+    
+    def _track_recent(self, message: str, level: str):
+        """Update the rolling trend window, evicting the oldest entry when full"""
+        if len(self._recent_errors) == self._recent_errors.maxlen:
+            old_message, old_level = self._recent_errors[0]
+            self._recent_message_counts[old_message] -= 1
+            if not self._recent_message_counts[old_message]:
+                del self._recent_message_counts[old_message]
+            if old_level == "CRITICAL":
+                self._recent_critical -= 1
+        self._recent_errors.append((message, level))
+        self._recent_message_counts[message] += 1
+        if level == "CRITICAL":
+            self._recent_critical += 1
+    
     def _get_logger_for_category(self, category: ErrorCategory) -> logging.Logger:
         """Route errors to appropriate specialized logger"""
-        if category in [ErrorCategory.NETWORK, ErrorCategory.SEC_API]:
-            return self.network_logger
-        elif category == ErrorCategory.DATA_PROCESSING:
-            return self.data_logger
-        elif category == ErrorCategory.USER_INPUT:
-            return self.user_logger
-        else:
-            return self.main_logger
+        return self._logger_by_category.get(category, self.main_logger)
     
     def _format_error_message(self, error_record: Dict[str, Any], detail_level: DetailLevel) -> str:
         """Format error message based on detail level"""
@@ -194,22 +530,28 @@ class SECFinancialErrorLogger:
             return base_msg
             
         elif detail_level == DetailLevel.STANDARD:
-            context_str = ""
-            if "context" in error_record:
-                context_str = f" | Context: {json.dumps(error_record['context'], default=str)}"
-            return f"{base_msg}{context_str}"
+            if "context" not in error_record:
+                return base_msg
+            return f"{base_msg} | Context: {_dumps(error_record['context'])}"
             
         elif detail_level == DetailLevel.DETAILED:
-            details = []
-            if "context" in error_record:
-                details.append(f"Context: {json.dumps(error_record['context'], default=str)}")
-            if "request_data" in error_record:
-                details.append(f"Request: {json.dumps(error_record['request_data'], default=str)}")
-            detail_str = " | ".join(details)
-            return f"{base_msg} | {detail_str}"
+            has_context = "context" in error_record
+            has_request = "request_data" in error_record
+            if has_context and has_request:
+                return (f"{base_msg} | Context: {_dumps(error_record['context'])}"
+                        f" | Request: {_dumps(error_record['request_data'])}")
+            if has_context:
+                return f"{base_msg} | Context: {_dumps(error_record['context'])}"
+            if has_request:
+                return f"{base_msg} | Request: {_dumps(error_record['request_data'])}"
+            return f"{base_msg} | "
             
         else:  # FORENSIC
-            return f"{base_msg} | FULL_RECORD: {json.dumps(error_record, default=str, indent=2)}"
+            # Environment is fixed per session; splice in its pre-serialized JSON
+            record_json = _dumps({k: v for k, v in error_record.items() if k != "environment"})
+            if "environment" in error_record:
+                record_json = f'{record_json[:-1]},"environment":{self._env_json}}}'
+            return f"{base_msg} | FULL_RECORD: {record_json}"
     
     # Specialized logging methods for common SEC analysis scenarios
     
@@ -237,22 +579,25 @@ class SECFinancialErrorLogger:
             message = f"SEC API Error - Status: {status_code} - Endpoint: {endpoint}"
             level = ErrorLevel.ERROR
             
-        return self.log_error(message, ErrorCategory.SEC_API, level, detail_level, context)
+        return self.log_error(message, ErrorCategory.SEC_API, level, detail_level, context,
+                              aggregate_key=(ErrorCategory.SEC_API, endpoint, status_code))
     
     def log_network_timeout(self, url: str, timeout_duration: float, attempt_number: int,
                            detail_level: DetailLevel = DetailLevel.DETAILED):
         """Log network timeout with retry context"""
+        self._timeout_count += 1
         context = {
             "url": url,
             "timeout_duration": timeout_duration,
             "attempt_number": attempt_number,
-            "total_attempts_in_session": len([e for e in self.session_errors if "timeout" in e.get("message", "").lower()])
+            "total_attempts_in_session": self._timeout_count
         }
         
         message = f"Network Timeout - URL: {url} - Duration: {timeout_duration}s - Attempt: {attempt_number}"
         level = ErrorLevel.WARNING if attempt_number < 3 else ErrorLevel.ERROR
         
-        return self.log_error(message, ErrorCategory.NETWORK, level, detail_level, context)
+        return self.log_error(message, ErrorCategory.NETWORK, level, detail_level, context,
+                              aggregate_key=(ErrorCategory.NETWORK, url))
     
     def log_data_processing_error(self, step: str, data_type: str, error_details: str,
                                  sample_data: Any = None, detail_level: DetailLevel = DetailLevel.DETAILED):
@@ -284,7 +629,8 @@ class SECFinancialErrorLogger:
         
         message = f"Calculation Error - Metric: {metric} - Type: {calculation_type}"
         
-        return self.log_error(message, ErrorCategory.CALCULATION, ErrorLevel.ERROR, detail_level, context)
+        return self.log_error(message, ErrorCategory.CALCULATION, ErrorLevel.ERROR, detail_level, context,
+                              aggregate_key=(ErrorCategory.CALCULATION, metric, calculation_type))
     
     def log_user_input_error(self, input_field: str, input_value: str, validation_error: str,
                            suggestions: List[str] = None, detail_level: DetailLevel = DetailLevel.STANDARD):
@@ -317,35 +663,34 @@ class SECFinancialErrorLogger:
     
     def get_error_summary(self) -> Dict[str, Any]:
         """Get summary of errors for debugging and analysis"""
+        self._flush_aggregates(time.monotonic())
         return {
             "session_id": self.session_id,
-            "total_errors": len(self.session_errors),
+            "total_errors": self._total_errors,
             "error_counts_by_category": self.error_counts,
-            "recent_errors": self.session_errors[-5:] if self.session_errors else [],
+            "recent_errors": self._tail_errors(5),
             "error_trends": self._analyze_error_trends(),
             "environment_info": self.environment_info
         }
     
+    def _tail_errors(self, count: int) -> List[Dict[str, Any]]:
+        """Return the last `count` stored error records"""
+        return list(islice(self.session_errors, max(0, len(self.session_errors) - count), None))
+    
     def _analyze_error_trends(self) -> Dict[str, Any]:
         """Analyze error patterns for insights"""
         if not self.session_errors:
             return {"status": "no_errors"}
             
-        recent_errors = self.session_errors[-10:]
-        
-        # Check for repeated errors
-        error_messages = [e.get("message", "") for e in recent_errors]
-        repeated_errors = len(error_messages) - len(set(error_messages))
-        
-        # Check for escalating error levels
-        error_levels = [e.get("level", "INFO") for e in recent_errors]
-        critical_errors = sum(1 for level in error_levels if level == "CRITICAL")
+        # Repeated messages and critical errors within the rolling window
+        repeated_errors = len(self._recent_errors) - len(self._recent_message_counts)
+        critical_errors = self._recent_critical
         
         return {
             "repeated_errors": repeated_errors,
             "critical_errors_recent": critical_errors,
             "dominant_category": max(self.error_counts.items(), key=lambda x: x[1])[0],
-            "error_frequency": len(self.session_errors) / max((time.time() - float(self.session_id.split('_')[-1])) / 60, 1)
+            "error_frequency": self._total_errors / max((time.time() - float(self.session_id.split('_')[-1])) / 60, 1)
         }
     
     def export_error_log(self, filepath: str = None) -> str:
@@ -353,15 +698,15 @@ class SECFinancialErrorLogger:
         if not filepath:
             filepath = f"error_log_{self.session_id}.json"
             
-        export_data = {
-            "export_timestamp": datetime.now().isoformat(),
-            "session_summary": self.get_error_summary(),
-            "all_errors": self.session_errors,
-            "environment_info": self.environment_info
-        }
-        
-        with open(filepath, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+        # Stream one record at a time so peak memory is bounded by a single record
+        with open(filepath, 'wb') as f:
+            f.write(b'{"export_timestamp":' + _dumps_bytes(datetime.now().isoformat()))
+            f.write(b',\n"session_summary":' + _dumps_bytes(self.get_error_summary()))
+            f.write(b',\n"all_errors":[')
+            for i, record in enumerate(self.session_errors):
+                f.write(b',\n' if i else b'\n')
+                f.write(_dumps_bytes(record))
+            f.write(b'\n],\n"environment_info":' + self._env_json.encode() + b'}\n')
             
         self.main_logger.info(f"Error log exported to: {filepath}")
         return filepath
@@ -5,9 +5,16 @@ Converts various fallback extraction formats to pipeline-compatible raw_data for
 
 from typing import Dict, List, Any
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+_is_revenue_metric = re.compile('revenue', re.IGNORECASE).search
+
+def _without_revenue(entries) -> List[Dict]:
+    """Drop existing revenue entries so fallback values replace them"""
+    return [entry for entry in entries if not _is_revenue_metric(entry.get('metric') or '')]
+
 def convert_fallback_to_raw_data(original_raw_data: Dict, fallback_result: Dict, ticker: str) -> Dict:
     """
     Convert multi-tier fallback results to raw_data format expected by pipeline
@@ -21,57 +28,46 @@ def convert_fallback_to_raw_data(original_raw_data: Dict, fallback_result: Dict,
     try:
         # Create enhanced raw_data structure
         enhanced_raw_data = original_raw_data.copy()
+        source = fallback_result.get('extraction_method', 'multi_tier_fallback')
         
         # Convert annual fallback data to raw_data format
         if fallback_result.get('annual'):
-            annual_entries = []
-            for period in fallback_result['annual']:
-                annual_entries.append({
+            annual_entries = [
+                {
                     'metric': 'Revenues',  # Use standard SEC fact name that normalization recognizes
                     'value': period.get('value', 0),
                     'fiscal_year': period.get('fiscal_year'),
                     'end_date': period.get('end_date', f"{period.get('fiscal_year', 2023)}-12-31"),
                     'extraction_method': period.get('extraction_method', 'fallback'),
-                    'source': fallback_result.get('extraction_method', 'multi_tier_fallback')
-                })
+                    'source': source
+                }
+                for period in fallback_result['annual']
+            ]
             
             # Replace existing revenue entries in annual data
-            if 'annual_data' in enhanced_raw_data:
-                # Remove existing revenue entries
-                enhanced_raw_data['annual_data'] = [
-                    entry for entry in enhanced_raw_data['annual_data'] 
-                    if 'revenue' not in entry.get('metric', '').lower()
-                ]
-                # Add fallback revenue entries
-                enhanced_raw_data['annual_data'].extend(annual_entries)
-            else:
-                enhanced_raw_data['annual_data'] = annual_entries
+            enhanced_raw_data['annual_data'] = _without_revenue(
+                enhanced_raw_data.get('annual_data', ())
+            ) + annual_entries
         
         # Convert quarterly fallback data to raw_data format  
         if fallback_result.get('quarterly'):
-            quarterly_entries = []
-            for period in fallback_result['quarterly']:
-                quarterly_entries.append({
+            quarterly_entries = [
+                {
                     'metric': 'Revenues',  # Use standard SEC fact name that normalization recognizes
                     'value': period.get('value', 0),
                     'fiscal_year': period.get('fiscal_year'),
                     'fiscal_quarter': period.get('fiscal_quarter', 'Q1'),
                     'end_date': period.get('end_date', f"{period.get('fiscal_year', 2023)}-03-31"),
                     'extraction_method': period.get('extraction_method', 'fallback'),
-                    'source': fallback_result.get('extraction_method', 'multi_tier_fallback')
-                })
+                    'source': source
+                }
+                for period in fallback_result['quarterly']
+            ]
             
             # Replace existing revenue entries in quarterly data
-            if 'quarterly_data' in enhanced_raw_data:
-                # Remove existing revenue entries
-                enhanced_raw_data['quarterly_data'] = [
-                    entry for entry in enhanced_raw_data['quarterly_data']
-                    if 'revenue' not in entry.get('metric', '').lower()
-                ]
-                # Add fallback revenue entries
-                enhanced_raw_data['quarterly_data'].extend(quarterly_entries)
-            else:
-                enhanced_raw_data['quarterly_data'] = quarterly_entries
+            enhanced_raw_data['quarterly_data'] = _without_revenue(
+                enhanced_raw_data.get('quarterly_data', ())
+            ) + quarterly_entries
         
         logger.info(f"✅ Successfully converted fallback data for {ticker}: "
                    f"{len(fallback_result.get('annual', []))} annual, "
@@ -6,10 +6,13 @@ import numpy as np
 from financial_tabulator import tabulate, add_growth_columns, add_cagr_columns
 
 KEY = ["ticker", "fiscal_year", "fiscal_quarter", "period_end", "currency"]
+METADATA_COLS = ["company", "shares_outstanding", "total_assets", "total_liabilities", "eps_basic", "eps_diluted"]
 
 class IntegrationPipeline:
     def __init__(self, value_cols: Optional[List[str]] = None):
         self.value_cols = value_cols or ["revenue", "gross_profit", "operating_income", "net_income", "operating_cash_flow", "capex", "free_cash_flow"]
+        # Columns resolved by combine, in output order
+        self.combine_cols = self.value_cols + METADATA_COLS
 
     def dataframe_from_scraped(self, scraped_records: List[Dict[str, Any]]) -> pd.DataFrame:
         df = tabulate(scraped_records)
@@ -25,37 +28,32 @@ class IntegrationPipeline:
             return df
         valcols = [c for c in self.value_cols if c in df.columns]
         if valcols:
-            df = df.dropna(axis=0, how="all", subset=valcols)
+            df = df.loc[df[valcols].notna().any(axis=1)]
+        # Already unique on KEY (typical for deduped EDGAR extracts): nothing to resolve
+        if not df.duplicated(subset=KEY).any():
+            return df.reset_index(drop=True)
         # Remove duplicates by max non-null count heuristic
-        df["_nonnull"] = df[valcols].notna().sum(axis=1) if valcols else 0
-        df = df.sort_values(by=KEY + ["_nonnull"], na_position="last").drop_duplicates(subset=KEY, keep="last").drop(columns=["_nonnull"]) if len(df) else df
+        df = df.assign(_nonnull=df[valcols].notna().to_numpy().sum(axis=1) if valcols else 0)
+        df = df.sort_values(by=KEY + ["_nonnull"], na_position="last").drop_duplicates(subset=KEY, keep="last").drop(columns=["_nonnull"])
         return df.reset_index(drop=True)
 
+    def _keyed(self, df: pd.DataFrame) -> pd.DataFrame:
+        cols = [c for c in self.combine_cols if c in df.columns]
+        return df.set_index(KEY)[cols]
+
     def combine(self, scraped_df: pd.DataFrame, edgar_df: pd.DataFrame, prefer: str = "edgar") -> pd.DataFrame:
-        s = scraped_df.copy()
-        e = edgar_df.copy()
-        s.columns = [c + "__scraped" if c not in KEY else c for c in s.columns]
-        e.columns = [c + "__edgar" if c not in KEY else c for c in e.columns]
-        merged = pd.merge(s, e, on=KEY, how="outer")
-        # Resolve value columns
-        for col in self.value_cols:
-            sc = col + "__scraped"
-            ec = col + "__edgar"
-            if sc in merged.columns or ec in merged.columns:
-                if prefer == "edgar":
-                    merged[col] = merged.get(ec).combine_first(merged.get(sc))
-                else:
-                    merged[col] = merged.get(sc).combine_first(merged.get(ec))
-        # Resolve other fields
-        for c in ["company", "shares_outstanding", "total_assets", "total_liabilities", "eps_basic", "eps_diluted"]:
-            sc = c + "__scraped"
-            ec = c + "__edgar"
-            if sc in merged.columns or ec in merged.columns:
-                merged[c] = merged.get(ec).combine_first(merged.get(sc)) if prefer == "edgar" else merged.get(sc).combine_first(merged.get(ec))
-        keep = [c for c in merged.columns if c in KEY or c in self.value_cols or c in ["company", "shares_outstanding", "total_assets", "total_liabilities", "eps_basic", "eps_diluted"]]
-        merged = merged[keep]
-        merged = merged.sort_values(by=KEY, na_position="last").reset_index(drop=True)
+        # Index views over only the columns combine keeps; inputs are never copied or renamed
+        s = self._keyed(scraped_df)
+        e = self._keyed(edgar_df)
+        primary, secondary = (e, s) if prefer == "edgar" else (s, e)
+        # Frame-level combine_first aligns on KEY once and fills gaps column-wise
+        merged = primary.combine_first(secondary)
+        keep = [c for c in self.combine_cols if c in merged.columns]
+        # combine_first returns the union of both KEY indexes already sorted, and the
+        # enrichment steps sort each ticker group themselves, so no extra sort here
+        merged = merged.reindex(columns=keep).reset_index()
         # Enrich
-        merged = add_growth_columns(merged, value_cols=[c for c in self.value_cols if c in merged.columns])
-        merged = add_cagr_columns(merged, value_cols=[c for c in self.value_cols if c in merged.columns], window=3)
+        present = [c for c in self.value_cols if c in keep]
+        merged = add_growth_columns(merged, value_cols=present)
+        merged = add_cagr_columns(merged, value_cols=present, window=3)
         return merged
\ No newline at end of file
@@ -1,13 +1,22 @@
 # Enhanced SEC EDGAR parser and indexer (HTML tables, optional XBRL via Arelle, submissions JSON index)
 
-from typing import List, Dict, Any, Optional
+from typing import IO, List, Dict, Any, Optional, Union
+import datetime as _dt
+import functools
+import io
 import re
+import threading
 
 try:
     from bs4 import BeautifulSoup
 except Exception:
     BeautifulSoup = None
 
+try:
+    from lxml import etree
+except Exception:
+    etree = None
+
 # Optional Arelle integration for XBRL if installed
 try:
     from arelle import Cntlr
@@ -29,74 +38,133 @@ LABEL_MAP = {
     r"^total assets$": "total_assets",
     r"^total liabilities$": "total_liabilities",
 }
-COMPILED = [(re.compile(pat, re.I), field) for pat, field in LABEL_MAP.items()]
+# All label patterns in one regex. Each branch is a lookahead from the start of the
+# cell followed by an empty group named after its field, so the first pattern in
+# LABEL_MAP that matches anywhere wins and match.lastgroup names the field.
+LABEL_RX = re.compile(
+    "|".join(f"(?=.*?(?:{pat}))(?P<{field}>)" for pat, field in LABEL_MAP.items()),
+    re.I | re.S,
+)
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_label(text: str) -> Optional[str]:
-    t = (text or "").strip()
-    for rx, field in COMPILED:
-        if rx.search(t):
-            return field
-    return None
-
-
-def parse_html_financial_table(html: str, ticker: Optional[str] = None, company: Optional[str] = None, currency: Optional[str] = None) -> List[Dict[str, Any]]:
-    if BeautifulSoup is None:
-        raise RuntimeError("bs4 is required to parse HTML tables")
-    soup = BeautifulSoup(html, "html.parser")
-    tables = soup.find_all("table")
-    records: List[Dict[str, Any]] = []
-    for tbl in tables:
-        rows = tbl.find_all("tr")
-        if not rows:
+    # Row labels repeat across tables and filings; each distinct label is matched once
+    m = LABEL_RX.match((text or "").strip())
+    return m.lastgroup if m else None
+
+
+def _collect_table(rows, cells, text, records: List[Dict[str, Any]], ticker: Optional[str], company: Optional[str], currency: Optional[str]) -> None:
+    # Append one record per labelled cell of a table; cells/text adapt bs4 or lxml elements
+    if not rows:
+        return
+    headers = [text(th) for th in cells(rows[0])]
+    for r in rows[1:]:
+        cols = cells(r)
+        if len(cols) < 2:
+            continue
+        label = _normalize_label(text(cols[0]))
+        if not label:
             continue
-        headers = [th.get_text(" ", strip=True) for th in rows[0].find_all(["th", "td"]) ]
-        for r in rows[1:]:
-            cols = r.find_all(["td", "th"])
-            if len(cols) < 2:
-                continue
-            label = _normalize_label(cols[0].get_text(" ", strip=True))
-            if not label:
-                continue
-            for idx in range(1, len(cols)):
-                period = headers[idx] if idx < len(headers) else ""
-                value_text = cols[idx].get_text(" ", strip=True)
-                rec = {
-                    "ticker": ticker,
-                    "company": company,
-                    "period_header": period,
-                    "label": label,
-                    "value_raw": value_text,
-                    "currency": currency
-                }
-                records.append(rec)
+        for idx in range(1, len(cols)):
+            records.append({
+                "ticker": ticker,
+                "company": company,
+                "period_header": headers[idx] if idx < len(headers) else "",
+                "label": label,
+                "value_raw": text(cols[idx]),
+                "currency": currency
+            })
+
+
+def _lxml_cells(row) -> list:
+    return list(row.iter("td", "th"))
+
+
+def _lxml_text(el) -> str:
+    # Same result as bs4's get_text(" ", strip=True)
+    return " ".join(t for t in (s.strip() for s in el.itertext()) if t)
+
+
+def _collect_tables_streaming(source, records: List[Dict[str, Any]], ticker: Optional[str], company: Optional[str], currency: Optional[str], encoding: Optional[str] = None) -> None:
+    # Parse incrementally and drop each top-level table once processed, so peak
+    # memory is bounded by the largest table rather than the whole filing.
+    # Without an encoding libxml2's HTML parser reads undeclared bytes as Latin-1.
+    context = etree.iterparse(source, events=("end",), tag="table", html=True, recover=True, encoding=encoding)
+    try:
+        for _, tbl in context:
+            if next(tbl.iterancestors("table"), None) is not None:
+                continue  # nested tables are handled with their outermost table
+            for t in tbl.iter("table"):
+                _collect_table(list(t.iter("tr")), _lxml_cells, _lxml_text, records, ticker, company, currency)
+            tbl.clear(keep_tail=True)
+            for node in (tbl, *tbl.iterancestors()):
+                while node.getprevious() is not None:
+                    del node.getparent()[0]
+    except etree.XMLSyntaxError:
+        pass  # empty or unparseable document: keep whatever was collected
+
+
+def parse_html_financial_table(html: Union[str, bytes, IO], ticker: Optional[str] = None, company: Optional[str] = None, currency: Optional[str] = None) -> List[Dict[str, Any]]:
+    # html may be a string, bytes or a binary file object (streamed when lxml is available)
+    records: List[Dict[str, Any]] = []
+    if etree is not None:
+        encoding = None
+        if isinstance(html, str):
+            html = html.encode("utf-8")
+            encoding = "utf-8"
+        source = io.BytesIO(html) if isinstance(html, bytes) else html
+        _collect_tables_streaming(source, records, ticker, company, currency, encoding)
+    else:
+        if BeautifulSoup is None:
+            raise RuntimeError("bs4 is required to parse HTML tables")
+        soup = BeautifulSoup(html if isinstance(html, (str, bytes)) else html.read(), "html.parser")
+        for tbl in soup.find_all("table"):
+            _collect_table(tbl.find_all("tr"), lambda r: r.find_all(["td", "th"]),
+                           lambda el: el.get_text(" ", strip=True), records, ticker, company, currency)
     return records
 
 
+_YEAR_RX = re.compile(r"(20\d{2})")
+_QUARTER_RX = re.compile(r"Q\s*(\d)", re.I)
+# Header shape -> strptime formats that can match it, in the original try order.
+# Only headers shaped like a date reach strptime, so most headers raise nothing.
+_PERIOD_FORMAT_PROBES = [
+    (re.compile(r"\d{4}-\d{1,2}-\s?\d{1,2}"), ["%Y-%m-%d"]),
+    (re.compile(r"\d{1,2}/\s?\d{1,2}/\d{4}"), ["%m/%d/%Y", "%d/%m/%Y"]),
+    (re.compile(r"[^\W\d_]+\s+\s?\d{1,2},\s+\d{4}"), ["%b %d, %Y", "%B %d, %Y"]),
+]
+
+
+def _parse_period(p: str):
+    p = (p or "").strip()
+    fy = None
+    fq = None
+    date = None
+    m = _YEAR_RX.search(p)
+    if m:
+        fy = int(m.group(1))
+    mq = _QUARTER_RX.search(p)
+    if mq:
+        fq = int(mq.group(1))
+    for probe, formats in _PERIOD_FORMAT_PROBES:
+        if probe.fullmatch(p):
+            for fmt in formats:
+                try:
+                    date = _dt.datetime.strptime(p, fmt).date().isoformat()
+                    break
+                except ValueError:
+                    pass
+            break
+    return fy, fq, date
+
+
 def records_to_periodized_financials(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    import datetime as _dt
     out: Dict[str, Dict[str, Any]] = {}
-    def parse_period(p: str):
-        p = (p or "").strip()
-        fy = None
-        fq = None
-        date = None
-        m = re.search(r"(20\d{2})", p)
-        if m:
-            fy = int(m.group(1))
-        mq = re.search(r"Q\s*(\d)", p, re.I)
-        if mq:
-            fq = int(mq.group(1))
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%b %d, %Y", "%B %d, %Y"]:
-            try:
-                date = _dt.datetime.strptime(p, fmt).date().isoformat()
-                break
-            except Exception:
-                pass
-        return fy, fq, date
+    # Every row of a table repeats the same column headers; parse each distinct one once
+    periods = {key: _parse_period(key) for key in {rec.get("period_header") or "" for rec in records}}
     for rec in records:
-        key = rec.get("period_header") or ""
-        fy, fq, date = parse_period(key)
+        fy, fq, date = periods[rec.get("period_header") or ""]
         out_key = (fy, fq, date, rec.get("currency"), rec.get("ticker"), rec.get("company"))
         if out_key not in out:
             out[out_key] = {
@@ -122,42 +190,57 @@ XBRL_CONCEPTS = {
     "total_assets": ["us-gaap:Assets"],
     "total_liabilities": ["us-gaap:Liabilities"],
 }
+CONCEPT_TO_FIELD = {concept: field for field, concepts in XBRL_CONCEPTS.items() for concept in concepts}
 
 
-def parse_xbrl_via_arelle(xbrl_path: str, ticker: Optional[str] = None, company: Optional[str] = None, currency: Optional[str] = None) -> List[Dict[str, Any]]:
-    if not HAVE_ARELLE:
-        raise RuntimeError("Arelle is not installed. Install arelle to enable XBRL parsing.")
-    ctrl = Cntlr.Cntlr(logFileName=None)
-    model = ctrl.modelManager.load(xbrl_path)
+_ARELLE_LOCAL = threading.local()
+
+
+def _get_arelle_controller():
+    # Controller start-up loads plugins and taxonomy caches; build it once per thread
+    ctrl = getattr(_ARELLE_LOCAL, "ctrl", None)
+    if ctrl is None:
+        ctrl = _ARELLE_LOCAL.ctrl = Cntlr.Cntlr(logFileName=None)
+    return ctrl
+
+
+def _arelle_facts(model, ticker: Optional[str], company: Optional[str], currency: Optional[str]) -> List[Dict[str, Any]]:
     facts = []
     for f in model.factsInInstance:
         qname = f.qname if hasattr(f, "qname") else None
         if not qname:
             continue
-        concept = str(qname)
-        for field, concepts in XBRL_CONCEPTS.items():
-            if concept in concepts:
-                # Use context end date to infer period
-                period_end = None
-                try:
-                    period_end = f.context.endDatetime.date().isoformat()
-                except Exception:
-                    try:
-                        period_end = f.context.instantDatetime.date().isoformat()
-                    except Exception:
-                        period_end = None
-                val = None
-                try:
-                    val = float(str(f.xValue))
-                except Exception:
-                    val = None
-                facts.append({
-                    "ticker": ticker,
-                    "company": company,
-                    "period_end": period_end,
-                    field: val,
-                    "currency": currency
-                })
+        field = CONCEPT_TO_FIELD.get(str(qname))
+        if field is None:
+            continue
+        # Use context end date to infer period
+        context = getattr(f, "context", None)
+        period_dt = getattr(context, "endDatetime", None) or getattr(context, "instantDatetime", None)
+        period_end = period_dt.date().isoformat() if period_dt is not None else None
+        val = None
+        try:
+            val = float(str(f.xValue))
+        except Exception:
+            val = None
+        facts.append({
+            "ticker": ticker,
+            "company": company,
+            "period_end": period_end,
+            field: val,
+            "currency": currency
+        })
+    return facts
+
+
+def parse_xbrl_via_arelle(xbrl_path: str, ticker: Optional[str] = None, company: Optional[str] = None, currency: Optional[str] = None) -> List[Dict[str, Any]]:
+    if not HAVE_ARELLE:
+        raise RuntimeError("Arelle is not installed. Install arelle to enable XBRL parsing.")
+    model_manager = _get_arelle_controller().modelManager
+    model = model_manager.load(xbrl_path)
+    try:
+        facts = _arelle_facts(model, ticker, company, currency)
+    finally:
+        model_manager.close(model)
     # Coalesce by period_end
     out: Dict[str, Dict[str, Any]] = {}
     for r in facts:
@@ -177,24 +260,22 @@ def filings_from_submissions_json(submissions: Dict[str, Any], forms: Optional[L
     out = []
     filings = submissions.get("filings", {}).get("recent", {})
     tickers = submissions.get("tickers") or []
+    ticker = tickers[0] if tickers else None
     cik = submissions.get("cik")
-    for i in range(len(filings.get("form", []))):
-        form = filings["form"][i]
+    report_dates = filings.get("reportDate", [])
+    periods = filings.get("periodOfReport", [])
+    for i, form in enumerate(filings.get("form", [])):
         if form not in forms:
             continue
-        acc = filings["accessionNumber"][i]
-        report_date = filings["reportDate"][i] if i < len(filings.get("reportDate", [])) else None
-        period = filings["periodOfReport"][i] if i < len(filings.get("periodOfReport", [])) else None
-        primary_doc = filings["primaryDocument"][i]
         out.append({
             "cik": cik,
-            "ticker": tickers[0] if tickers else None,
+            "ticker": ticker,
             "form": form,
-            "accession": acc,
-            "report_date": report_date,
-            "period_of_report": period,
-            "primary_document": primary_doc
+            "accession": filings["accessionNumber"][i],
+            "report_date": report_dates[i] if i < len(report_dates) else None,
+            "period_of_report": periods[i] if i < len(periods) else None,
+            "primary_document": filings["primaryDocument"][i]
         })
         if max_items and len(out) >= max_items:
             break
-    return out
\ No newline at end of file
+    return out
@@ -3,6 +3,7 @@
 
 from typing import List, Dict, Optional, Union
 import math
+import numpy as np
 
 Number = Union[int, float]
 
@@ -39,6 +40,26 @@ def qoq_growth(series: List[Optional[Number]], period: int = 1) -> List[Optional
             out.append(percent_growth(series[j], v))
     return out
 
+def growth_pct(previous: np.ndarray, current: np.ndarray) -> np.ndarray:
+    # Element-wise percent_growth for arrays: NaN where previous is 0 or NaN
+    previous = np.asarray(previous, dtype=np.float64)
+    current = np.asarray(current, dtype=np.float64)
+    scale = np.full(previous.shape, np.nan)
+    np.divide(100.0, np.abs(previous), out=scale, where=previous != 0.0)
+    return (current - previous) * scale
+
+def yoy_growth_np(arr: np.ndarray) -> np.ndarray:
+    # Array counterpart of yoy_growth; NaN marks the first point and undefined growth
+    return qoq_growth_np(arr, 1)
+
+def qoq_growth_np(arr: np.ndarray, period: int = 1) -> np.ndarray:
+    # Array counterpart of qoq_growth with lag = period
+    arr = np.asarray(arr, dtype=np.float64)
+    out = np.full(arr.shape, np.nan)
+    if period > 0 and len(arr) > period:
+        out[period:] = growth_pct(arr[:-period], arr[period:])
+    return out
+
 def cagr(start: Number, end: Number, periods: Number) -> Optional[float]:
     # Compound Annual Growth Rate as percentage
     try:
@@ -61,17 +82,23 @@ def cagr_from_series(series: List[Optional[Number]], years: Optional[float] = No
     return cagr(start, end, n)
 
 def rolling_cagr(series: List[Optional[Number]], window: int) -> List[Optional[float]]:
-    # Rolling CAGR over a moving window length
-    out = []
-    for i in range(len(series)):
-        j = i - window
-        if j < 0:
-            out.append(None)
-        else:
-            start = series[j]
-            end = series[i]
-            out.append(cagr(start, end, window))
-    return out
+    # Rolling CAGR over a moving window length, computed over the whole series at once
+    n = len(series)
+    if window <= 0:
+        return [None] * n
+    try:
+        arr = np.asarray(series, dtype=np.float64)
+    except (TypeError, ValueError):
+        return [cagr(series[i - window], series[i], window) if i >= window else None for i in range(n)]
+    missing = np.fromiter((x is None for x in series), dtype=bool, count=n)
+    start, end = arr[:-window], arr[window:]
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        ratio = end / start
+        growth = (np.power(ratio, 1.0 / window) - 1.0) * 100.0
+    # Same None cases as cagr(): missing input, non-positive start, or a negative
+    # ratio that math.pow rejects; NaN inputs still propagate as NaN
+    invalid = missing[:-window] | missing[window:] | (start <= 0.0) | (np.isnan(growth) & ~np.isnan(ratio))
+    return [None] * min(window, n) + [None if bad else float(g) for g, bad in zip(growth, invalid)]
 
 def safe_pct(value: Optional[float]) -> Optional[str]:
     if value is None:
@@ -57,8 +57,11 @@ ORDER_COLS = [
 ]
 
 
-def normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
-    # Map aliases to canonical names and cast numeric fields
+NUMERIC_SUFFIXES = {"M": 1e6, "B": 1e9, "K": 1e3}
+
+
+def _canonical_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    # Map aliases to canonical names and ensure presence of all canonical fields
     norm = {}
     for k, v in record.items():
         key = k
@@ -66,10 +69,15 @@ def normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
             key = ALIASES[key]
         if key in CANONICAL_FIELDS:
             norm[key] = v
-    # Ensure presence of all canonical
     for k in CANONICAL_FIELDS.keys():
         if k not in norm:
             norm[k] = None
+    return norm
+
+
+def normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    # Map aliases to canonical names and cast numeric fields
+    norm = _canonical_record(record)
     # Numeric casts
     for k in list(norm.keys()):
         if k in NUMERIC_FIELDS and norm[k] is not None:
@@ -89,9 +97,23 @@ def normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
     return norm
 
 
+def _cast_numeric_column(col: pd.Series) -> pd.Series:
+    # Column-wise equivalent of normalize_record's numeric casts
+    present = col.notna()
+    if not present.any():
+        return col
+    s = col[present].astype(str).str.replace(",", "", regex=False).str.replace(" ", "", regex=False)
+    mult = s.str[-1].map(NUMERIC_SUFFIXES)
+    body = s.where(mult.isna(), s.str[:-1]).str.strip()
+    values = pd.to_numeric(body, errors="coerce") * mult.fillna(1.0)
+    return values.reindex(col.index)
+
+
 def tabulate(records: List[Dict[str, Any]]) -> pd.DataFrame:
-    rows = [normalize_record(r) for r in records]
+    rows = [_canonical_record(r) for r in records]
     df = pd.DataFrame(rows)
+    for col in NUMERIC_FIELDS.intersection(df.columns):
+        df[col] = _cast_numeric_column(df[col])
     # Order columns
     cols = [c for c in ORDER_COLS if c in df.columns] + [c for c in df.columns if c not in ORDER_COLS]
     df = df[cols]
@@ -103,61 +125,54 @@ def tabulate(records: List[Dict[str, Any]]) -> pd.DataFrame:
 
 def add_growth_columns(df: pd.DataFrame, value_cols: Optional[List[str]] = None, group_col: str = "ticker") -> pd.DataFrame:
     import numpy as np
+    from financial_metrics import growth_pct
     if value_cols is None:
         value_cols = ["revenue", "gross_profit", "operating_income", "net_income", "free_cash_flow"]
-    df = df.copy()
-    df["period_index"] = range(len(df))
-    # Group by ticker and compute YoY and QoQ if quarterly data exists
-    def compute(group):
-        group = group.sort_values(by=["fiscal_year", "fiscal_quarter", "period_end"])
-        for col in value_cols:
-            prev = group[col].shift(1)
-            with np.errstate(divide='ignore', invalid='ignore'):
-                yoy = (group[col] - prev) / abs(prev) * 100.0
-            group[col + "_growth_pct"] = yoy.replace([np.inf, -np.inf], np.nan)
-        return group
-    df = df.groupby(group_col, dropna=False).apply(compute).reset_index(drop=True)
-    return df.drop(columns=["period_index"]) if "period_index" in df.columns else df
+    # Sort once by group then period (groupby's key order, NaN groups last) and lag
+    # every value column within its group in a single shift
+    df = df.sort_values(by=[group_col, "fiscal_year", "fiscal_quarter", "period_end"], na_position="last").reset_index(drop=True)
+    current = df[value_cols].to_numpy(dtype=float)
+    prev = df.groupby(group_col, dropna=False)[value_cols].shift(1).to_numpy(dtype=float)
+    with np.errstate(invalid='ignore', over='ignore'):
+        growth = growth_pct(prev, current)
+    growth[np.isinf(growth)] = np.nan
+    return df.assign(**{col + "_growth_pct": growth[:, i] for i, col in enumerate(value_cols)})
 
 
 def add_cagr_columns(df: pd.DataFrame, value_cols: Optional[List[str]] = None, group_col: str = "ticker", years_col: Optional[str] = None, window: Optional[int] = None) -> pd.DataFrame:
     import numpy as np
-    from financial_metrics import cagr
+    from financial_metrics import cagr, rolling_cagr
     if value_cols is None:
         value_cols = ["revenue", "net_income", "free_cash_flow"]
-    df = df.copy()
-    def compute(group):
-        group = group.sort_values(by=["fiscal_year", "fiscal_quarter", "period_end"])
-        n = None
-        if years_col and years_col in group.columns:
+    # Sort once so every group is a contiguous, period-ordered block; total CAGR only
+    # needs the first and last row of each block
+    df = df.sort_values(by=[group_col, "fiscal_year", "fiscal_quarter", "period_end"], na_position="last").reset_index(drop=True)
+    codes = df.groupby(group_col, dropna=False, sort=False).ngroup().to_numpy()
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.empty(0, dtype=np.intp)
+    ends = np.r_[starts[1:], len(codes)].astype(np.intp) - 1
+    sizes = ends - starts + 1
+    spans = [None] * len(starts)
+    if years_col and years_col in df.columns:
+        years = df[years_col].to_numpy()
+        for k, (i, j) in enumerate(zip(starts, ends)):
             try:
-                n = float(group[years_col].iloc[-1]) - float(group[years_col].iloc[0])
-                if n <= 0:
-                    n = None
+                span = float(years[j]) - float(years[i])
+                spans[k] = span if span > 0 else None
             except Exception:
-                n = None
-        for col in value_cols:
-            vals = group[col].astype(float).tolist()
-            if len(vals) >= 2:
-                periods = n if n is not None else max(1, len(vals) - 1)
-                try:
-                    cg = cagr(vals[0], vals[-1], periods)
-                except Exception:
-                    cg = None
-            else:
-                cg = None
-            group[col + "_CAGR_pct_total"] = cg
-            if window is not None and window >= 2:
-                out = []
-                for i in range(len(vals)):
-                    j = i - window
-                    if j < 0:
-                        out.append(None)
-                    else:
-                        try:
-                            out.append(cagr(vals[j], vals[i], window))
-                        except Exception:
-                            out.append(None)
-                group[col + "_CAGR_pct_" + str(window) + "y"] = out
-        return group
-    return df.groupby(group_col, dropna=False).apply(compute).reset_index(drop=True)
\ No newline at end of file
+                pass
+    if window is not None and window >= 2:
+        # Rolling windows must not reach back into the previous group
+        same_group = np.zeros(len(codes), dtype=bool)
+        same_group[window:] = codes[window:] == codes[:-window]
+    new_cols = {}
+    for col in value_cols:
+        vals = df[col].to_numpy(dtype=float)
+        totals = [
+            cagr(vals[i], vals[j], span if span is not None else max(1, size - 1)) if size >= 2 else None
+            for i, j, size, span in zip(starts, ends, sizes, spans)
+        ]
+        new_cols[col + "_CAGR_pct_total"] = np.repeat(np.array(totals, dtype=object), sizes)
+        if window is not None and window >= 2:
+            rolled = rolling_cagr(vals.tolist(), window)
+            new_cols[col + "_CAGR_pct_" + str(window) + "y"] = [r if ok else None for r, ok in zip(rolled, same_group)]
+    return df.assign(**new_cols)
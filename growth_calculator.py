@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import math
+import numpy as np
 
 class GrowthCalculator:
     """Calculate various growth metrics for financial data"""
@@ -71,6 +72,38 @@ class GrowthCalculator:
         # Similar logic to YoY but for quarterly data
         return self.calculate_yoy_growth(current, previous)
     
+    def _growth_series(self, values: List[float]) -> List[Dict[str, Any]]:
+        """
+        Period-over-period growth for consecutive values, same results as calling
+        calculate_yoy_growth pairwise but with the arithmetic and display
+        formatting done once over the whole series
+        """
+        try:
+            arr = np.asarray(values, dtype=float)
+        except (TypeError, ValueError):
+            return [self.calculate_yoy_growth(values[i], values[i-1]) for i in range(1, len(values))]
+        if len(arr) < 2:
+            return []
+        current, previous = arr[1:], arr[:-1]
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            growth = (current - previous) / np.abs(previous)
+            displays = np.char.mod('%.1f%%', growth * 100).tolist()
+        
+        results = []
+        for cur, prev, g, display in zip(current.tolist(), previous.tolist(), growth.tolist(), displays):
+            if prev == 0:
+                if cur > 0:
+                    results.append({'value': None, 'display': 'N/A', 'note': 'Cannot calculate YoY from zero base'})
+                else:
+                    results.append({'value': 0, 'display': '0.0%', 'note': 'No change from zero'})
+            elif prev < 0 and cur > 0:
+                results.append({'value': None, 'display': 'Turnaround', 'note': 'From loss to profit'})
+            elif prev > 0 and cur < 0:
+                results.append({'value': None, 'display': 'Negative', 'note': 'From profit to loss'})
+            else:
+                results.append({'value': g, 'display': display, 'note': ''})
+        return results
+    
     def calculate_all_growth_metrics(self, processed_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate all growth metrics for the processed financial data"""
         growth_metrics = {
@@ -104,10 +137,10 @@ class GrowthCalculator:
                         growth_metrics['annual'][f'{metric}_cagr'] = cagr
                     
                     # Calculate YoY growth for recent years
-                    yoy_growth = []
-                    for i in range(1, len(metric_data)):
-                        yoy = self.calculate_yoy_growth(metric_data[i], metric_data[i-1])
-                        yoy_growth.append({'year': valid_years[i], 'growth': yoy})
+                    yoy_growth = [
+                        {'year': year, 'growth': yoy}
+                        for year, yoy in zip(valid_years[1:], self._growth_series(metric_data))
+                    ]
                     
                     growth_metrics['annual'][f'{metric}_yoy'] = yoy_growth
         
@@ -117,8 +150,6 @@ class GrowthCalculator:
             quarters = sorted(quarterly_data.keys())
             
             for metric in ['revenue', 'gross_profit', 'operating_income', 'net_income', 'eps']:
-                qoq_growth = []
-                
                 # Get values for this metric across quarters
                 values = []
                 valid_quarters = []
@@ -130,9 +161,10 @@ class GrowthCalculator:
                         valid_quarters.append(quarter)
                 
                 # Calculate QoQ growth
-                for i in range(1, len(values)):
-                    qoq = self.calculate_qoq_growth(values[i], values[i-1])
-                    qoq_growth.append({'quarter': valid_quarters[i], 'growth': qoq})
+                qoq_growth = [
+                    {'quarter': quarter, 'growth': qoq}
+                    for quarter, qoq in zip(valid_quarters[1:], self._growth_series(values))
+                ]
                 
                 if qoq_growth:
                     growth_metrics['quarterly'][f'{metric}_qoq'] = qoq_growth
@@ -6,6 +6,9 @@ Converts normalized PeriodBase and QuarterlyPeriod objects to format expected by
 from typing import List, Dict, Any
 from models import PeriodBase, QuarterlyPeriod
 
+# Period fields passed through to GrowthCalculator
+GROWTH_FIELDS = ('revenue', 'net_income', 'eps', 'assets', 'liabilities', 'cash_flow', 'gross_profit', 'operating_income')
+
 def prepare_growth_calculation_data(annual_periods: List[PeriodBase], quarterly_periods: List[QuarterlyPeriod]) -> Dict[str, Any]:
     """
     Convert canonical period objects to format expected by GrowthCalculator
@@ -23,39 +26,17 @@ def prepare_growth_calculation_data(annual_periods: List[PeriodBase], quarterly_
     }
     """
     
-    # Convert annual periods
-    annual_data = {}
-    for period in annual_periods:
-        year_key = str(period.fiscal_year)
-        annual_data[year_key] = {
-            'revenue': period.revenue,
-            'net_income': period.net_income,
-            'eps': period.eps,
-            'assets': period.assets,
-            'liabilities': period.liabilities,
-            'cash_flow': period.cash_flow,
-            'gross_profit': period.gross_profit,
-            'operating_income': period.operating_income
-        }
-        # Remove None values to avoid growth calculation issues
-        annual_data[year_key] = {k: v for k, v in annual_data[year_key].items() if v is not None}
+    # Convert annual periods, dropping None values to avoid growth calculation issues
+    annual_data = {
+        str(period.fiscal_year): {f: v for f in GROWTH_FIELDS if (v := getattr(period, f)) is not None}
+        for period in annual_periods
+    }
     
     # Convert quarterly periods
-    quarterly_data = {}
-    for period in quarterly_periods:
-        quarter_key = f"{period.fiscal_year}-{period.fiscal_quarter}"
-        quarterly_data[quarter_key] = {
-            'revenue': period.revenue,
-            'net_income': period.net_income,
-            'eps': period.eps,
-            'assets': period.assets,
-            'liabilities': period.liabilities,
-            'cash_flow': period.cash_flow,
-            'gross_profit': period.gross_profit,
-            'operating_income': period.operating_income
-        }
-        # Remove None values to avoid growth calculation issues
-        quarterly_data[quarter_key] = {k: v for k, v in quarterly_data[quarter_key].items() if v is not None}
+    quarterly_data = {
+        f"{period.fiscal_year}-{period.fiscal_quarter}": {f: v for f in GROWTH_FIELDS if (v := getattr(period, f)) is not None}
+        for period in quarterly_periods
+    }
     
     return {
         'annual_data': annual_data,
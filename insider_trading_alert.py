@@ -1,24 +1,28 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import lxml
 import os
+from concurrent.futures import ThreadPoolExecutor
 import smtplib, ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+# One keep-alive session so repeat requests to the same host reuse the TLS connection
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 def extract_tickers(url):
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=10)
     soup = BeautifulSoup(response.text, 'html.parser')
 
     table = soup.find('table', {'class': 'table-dark-row-cp'})
     if not table:
         return set()
 
-    tickers = set()
-    for row in table.find_all('tr'):
-        ticker = row.find_all('td')[2].text.strip() 
-        tickers.add(ticker)
-    return tickers
+    # Select only the ticker column rather than building every row's cell list
+    return {td.get_text().strip() for td in table.select('tr > td:nth-of-type(3)')}
 
 def send_email(matches):
     email = os.environ["EMAIL"]
@@ -41,18 +45,20 @@ def send_email(matches):
             email, email, message.as_string()
         )
 
-# Fetch tickers from Finviz
-finviz_insider_buy = extract_tickers("https://finviz.com/insidertrading.ashx?tc=1")
-finviz_insider_sell = extract_tickers("https://finviz.com/insidertrading.ashx?or=-10&tv=100000&tc=1&o=-transactionValue")
+# Finviz insider transactions and Yahoo Finance 52-week low/loss watchlists
+URLS = {
+    "finviz_buy": "https://finviz.com/insidertrading.ashx?tc=1",
+    "finviz_sell": "https://finviz.com/insidertrading.ashx?or=-10&tv=100000&tc=1&o=-transactionValue",
+    "yahoo_low": "https://finance.yahoo.com/u/yahoo-finance/watchlists/fiftytwo-wk-low/",
+    "yahoo_loss": "https://finance.yahoo.com/u/yahoo-finance/watchlists/fiftytwo-wk-loss/",
+}
 
-# Fetch tickers from Yahoo Finance (52-week lows)
-yahoo_52week_low = extract_tickers("https://finance.yahoo.com/u/yahoo-finance/watchlists/fiftytwo-wk-low/")
-yahoo_52week_loss = extract_tickers("https://finance.yahoo.com/u/yahoo-finance/watchlists/fiftytwo-wk-loss/") 
+# Fetch all pages concurrently; the work is network-bound so threads overlap the waits
+with ThreadPoolExecutor(len(URLS)) as executor:
+    results = dict(zip(URLS, executor.map(extract_tickers, URLS.values())))
 
 # Cross-reference and find matches
-matches = finviz_insider_buy.intersection(yahoo_52week_low).union(
-    finviz_insider_sell.intersection(yahoo_52week_loss)
-)
+matches = (results["finviz_buy"] & results["yahoo_low"]) | (results["finviz_sell"] & results["yahoo_loss"])
 
 # Send email alert if matches are found
 if matches:
@@ -3,16 +3,92 @@ Local SEC Data Manager - Offline-First Ticker Resolution
 Replaces API-dependent ticker lookup with local SEC index data
 """
 
+import functools
+import io
 import os
 import json
 import gzip
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple, List
-import requests
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, Tuple, List, Union
+import urllib3
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def _json_dumps(obj) -> bytes:
+    """Compact JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _json_loads(data: bytes):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _canonical_ticker(ticker: str) -> str:
+    """Share-class separator normalized to '-' (BRK.A -> BRK-A)"""
+    return ticker.replace(".", "-")
+
+# File buffer for the compressed mapping: 128 KiB instead of the 8 KiB default
+GZIP_IO_BUFFER = 128 * 1024
+
+@contextmanager
+def _open_gzip(path: Path, mode: str, compresslevel: int = 9) -> Iterator[gzip.GzipFile]:
+    """gzip.open equivalent over a file opened with a GZIP_IO_BUFFER-sized buffer"""
+    with open(path, mode, buffering=GZIP_IO_BUFFER) as raw, \
+            gzip.GzipFile(fileobj=raw, mode=mode, compresslevel=compresslevel) as gz:
+        yield gz
+
+def _pack_record(ticker: str, record: Dict) -> List[str]:
+    """On-disk form of a mapping entry: [cik, name], plus the ticker if it differs from the key"""
+    if record['ticker'] == ticker:
+        return [record['cik'], record['name']]
+    return [record['cik'], record['name'], record['ticker']]
+
+def _unpack_record(ticker: str, value) -> Tuple[str, str, str]:
+    """In-memory (cik, name, ticker) entry from either the packed list or the older dict form"""
+    if isinstance(value, dict):
+        return value['cik'], value['name'], value.get('ticker', ticker)
+    return value[0], value[1], value[2] if len(value) > 2 else ticker
+
+# Legal-form words that look like tickers at the end of company names
+TICKER_STOPWORDS = frozenset({'INC', 'LLC', 'CORP', 'CO', 'LTD'})
+
+@functools.lru_cache(maxsize=1024)
+def _lookup_key(ticker: str) -> str:
+    """Canonical map key for a user-entered ticker; UI reruns repeat the same few"""
+    return _canonical_ticker(ticker.upper().strip())
+
+def _paren_ticker(company_name: str) -> Optional[str]:
+    """First parenthesized group of 1-5 ASCII capitals: "APPLE INC (AAPL)" -> AAPL"""
+    start = company_name.find('(')
+    while start != -1:
+        end = company_name.find(')', start + 2, start + 7)
+        if end != -1:
+            inner = company_name[start + 1:end]
+            if inner.isascii() and inner.isalpha() and inner.isupper():
+                return inner
+        start = company_name.find('(', start + 1)
+    return None
+
 class LocalSECDataManager:
     """
     Manages local SEC data for offline-first ticker resolution
@@ -32,8 +108,9 @@ class LocalSECDataManager:
         self.ticker_mapping_file = self.data_dir / "ticker_mapping.json.gz"
         self.company_cache_file = self.data_dir / "company_cache.json.gz"
         self.last_update_file = self.data_dir / ".last_update"
+        self.ticker_count_file = self.data_dir / "ticker_count.txt"
         
-        # In-memory cache for performance
+        # In-memory cache for performance: canonical ticker -> (cik, name, ticker)
         self.ticker_map = None
         self.company_cache = {}
         
@@ -44,6 +121,8 @@ class LocalSECDataManager:
         # SEC compliance
         self.user_agent = "SEC Financial Analysis Tool admin@company.com"
         self.sec_rate_limit = 0.1  # 10 requests per second max
+        # maxsize=2 keeps both concurrent master-index HEAD probes' connections for reuse
+        self.http = urllib3.PoolManager(maxsize=2, headers={"User-Agent": self.user_agent, "Accept-Encoding": "gzip"})
         
     def ensure_data_ready(self) -> bool:
         """
@@ -70,30 +149,24 @@ class LocalSECDataManager:
             print("🔧 Creating minimal ticker data for basic functionality")
             self._create_fallback_data()
             return True
+        finally:
+            # Load the mapping now so the first lookup doesn't pay for decompression and parsing
+            self._load_ticker_mapping()
     
     def lookup_ticker(self, ticker: str) -> Optional[Dict]:
         """
         Look up ticker in local data
         Returns: {'cik': 'XXXXXXXXXX', 'name': 'Company Name', 'ticker': 'TICKER'}
         """
-        if not self.ticker_map:
+        if self.ticker_map is None:
             self._load_ticker_mapping()
         
-        # Normalize ticker for lookup
-        normalized_ticker = ticker.upper().strip()
-        
-        # Handle common ticker variations
-        variations = [
-            normalized_ticker,
-            normalized_ticker.replace(".", "-"),  # BRK.A -> BRK-A
-            normalized_ticker.replace("-", "."),  # BRK-A -> BRK.A
-        ]
-        
-        for variant in variations:
-            if self.ticker_map and variant in self.ticker_map:
-                return self.ticker_map[variant]
-        
-        return None
+        # Keys are stored in canonical form, so one probe covers BRK.A and BRK-A
+        record = self.ticker_map.get(_lookup_key(ticker))
+        if record is None:
+            return None
+        cik, name, symbol = record
+        return {'cik': cik, 'name': name, 'ticker': symbol}
     
     def get_data_status(self) -> Dict:
         """
@@ -171,16 +244,24 @@ class LocalSECDataManager:
     def _get_storage_size_mb(self) -> float:
         """Calculate total storage used by local data"""
         total_size = 0
-        for file_path in self.data_dir.glob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        # DirEntry caches the file type from the directory listing, leaving one stat per file
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    total_size += entry.stat().st_size
         return total_size / (1024 * 1024)
     
     def _count_tickers(self) -> int:
         """Count tickers without loading full mapping"""
+        # Count saved alongside the mapping; only trusted if written after it
+        try:
+            if self.ticker_count_file.stat().st_mtime >= self.ticker_mapping_file.stat().st_mtime:
+                return int(self.ticker_count_file.read_text())
+        except (OSError, ValueError):
+            pass
         try:
-            with gzip.open(self.ticker_mapping_file, 'rt') as f:
-                data = json.load(f)
+            with _open_gzip(self.ticker_mapping_file, 'rb') as f:
+                data = _json_loads(f.read())
                 return len(data)
         except:
             return 0
@@ -189,8 +270,13 @@ class LocalSECDataManager:
         """Load ticker mapping into memory"""
         try:
             if self.ticker_mapping_file.exists():
-                with gzip.open(self.ticker_mapping_file, 'rt') as f:
-                    self.ticker_map = json.load(f)
+                with _open_gzip(self.ticker_mapping_file, 'rb') as f:
+                    if IJSON_AVAILABLE:
+                        # Decompress and parse incrementally so the full JSON text is never held in memory
+                        items = ijson.kvitems(f, '')
+                    else:
+                        items = _json_loads(f.read()).items()
+                    self.ticker_map = {_canonical_ticker(k): _unpack_record(k, v) for k, v in items}
             else:
                 self.ticker_map = {}
         except Exception as e:
@@ -207,19 +293,25 @@ class LocalSECDataManager:
             master_url = self._get_latest_master_index_url()
             print(f"📡 Downloading SEC index from: {master_url}")
             
-            headers = {"User-Agent": self.user_agent}
-            response = requests.get(master_url, headers=headers, timeout=30)
+            # Ask for a gzip-encoded body and parse the index line by line as it is
+            # decompressed, instead of buffering the whole file
+            response = self.http.request("GET", master_url, timeout=30.0, preload_content=False)
+            response.auto_close = False  # let TextIOWrapper see EOF instead of a closed file
+            try:
+                if response.status == 200:
+                    lines = io.TextIOWrapper(response, encoding='utf-8', errors='replace')
+                    ticker_mapping = self._process_index_content(lines)
+                else:
+                    print(f"❌ Failed to download index: {response.status}")
+                    return False
+            finally:
+                response.release_conn()
             
-            if response.status_code == 200:
-                ticker_mapping = self._process_index_content(response.text)
-                # Apply corrections for known ticker mapping issues
-                corrected_mapping = self._apply_ticker_corrections(ticker_mapping)
-                self._save_ticker_mapping(corrected_mapping)
-                self._mark_update_time()
-                return True
-            else:
-                print(f"❌ Failed to download index: {response.status_code}")
-                return False
+            # Apply corrections for known ticker mapping issues
+            corrected_mapping = self._apply_ticker_corrections(ticker_mapping)
+            self._save_ticker_mapping(corrected_mapping)
+            self._mark_update_time()
+            return True
                 
         except Exception as e:
             logging.error(f"Failed to download and process index: {e}")
@@ -233,7 +325,8 @@ class LocalSECDataManager:
         now = datetime.now()
         current_quarter = ((now.month - 1) // 3) + 1
         
-        # Try current quarter first, then previous quarter
+        # Candidates in order of preference: current quarter first, then previous quarter
+        candidate_urls = []
         for quarter_offset in [0, -1]:
             target_quarter = current_quarter + quarter_offset
             target_year = now.year
@@ -242,31 +335,48 @@ class LocalSECDataManager:
                 target_quarter = 4
                 target_year -= 1
             
-            url = f"https://www.sec.gov/Archives/edgar/full-index/{target_year}/QTR{target_quarter}/master.idx"
-            
-            # Quick check if this URL exists
-            try:
-                headers = {"User-Agent": self.user_agent}
-                response = requests.head(url, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    return url
-            except:
-                continue
+            candidate_urls.append(f"https://www.sec.gov/Archives/edgar/full-index/{target_year}/QTR{target_quarter}/master.idx")
+        
+        # Probe all candidates at once so a slow or missing quarter costs one timeout, not one each;
+        # two workers keep us well inside the SEC request rate limit
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            available = list(executor.map(self._head_ok, candidate_urls))
+        for url, ok in zip(candidate_urls, available):
+            if ok:
+                return url
         
         # Fallback to a known working URL pattern
         return "https://www.sec.gov/Archives/edgar/full-index/2024/QTR4/master.idx"
     
-    def _process_index_content(self, content: str) -> Dict[str, Dict]:
+    def _head_ok(self, url: str) -> bool:
+        """Quick check if this URL exists"""
+        try:
+            # Shares the pooled connections and User-Agent; like requests.head, no redirects
+            response = self.http.request("HEAD", url, timeout=10.0, retries=False)
+            return response.status == 200
+        except Exception:
+            return False
+    
+    def _process_index_content(self, content: Union[str, Iterable[str]]) -> Dict[str, Dict]:
         """
         Process SEC master index file content into ticker mapping
         Format: CIK|Company Name|Form Type|Date Filed|Filename
+        Accepts the full text or any iterable of lines (e.g. a streamed response)
         """
-        ticker_mapping = {}
-        lines = content.split('\n')
+        lines = io.StringIO(content) if isinstance(content, str) else content
         
-        # Skip header lines (first 11 lines are metadata)
-        data_lines = lines[11:]
+        # Skip header lines (first 11 lines are metadata); later entries for a
+        # ticker overwrite earlier ones, as dict() keeps the last pair per key
+        ticker_mapping = dict(self._iter_index_entries(islice(lines, 11, None)))
         
+        print(f"📊 Processed {len(ticker_mapping)} ticker mappings")
+        return ticker_mapping
+    
+    def _iter_index_entries(self, data_lines: Iterable[str]) -> Iterator[Tuple[str, Dict]]:
+        """Yield (ticker, record) pairs for index lines that carry a usable ticker"""
+        # A company files many forms per quarter; parse each (CIK, name) pair once and
+        # re-yield the cached entry so later filings still win in the final mapping
+        entries: Dict[Tuple[str, str], Optional[Tuple[str, Dict]]] = {}
         for line in data_lines:
             if not line.strip() or line.startswith('---'):
                 continue
@@ -275,50 +385,56 @@ class LocalSECDataManager:
             if len(parts) != 5:
                 continue
             
-            cik, company_name, form_type, date_filed, filename = parts
-            cik = cik.strip()
-            company_name = company_name.strip()
-            
-            # Extract ticker from company name or filename
-            ticker = self._extract_ticker(company_name, filename)
-            
-            if ticker and len(ticker) <= 5 and ticker.isalpha():
-                ticker_mapping[ticker] = {
-                    'cik': cik.zfill(10),  # Pad CIK to 10 digits
-                    'name': company_name,
-                    'ticker': ticker
-                }
+            key = (parts[0], parts[1])
+            if key in entries:
+                entry = entries[key]
+            else:
+                entry = entries[key] = self._index_entry(parts[0], parts[1], parts[4])
+            if entry is not None:
+                yield entry
+    
+    def _index_entry(self, cik: str, company_name: str, filename: str) -> Optional[Tuple[str, Dict]]:
+        """(ticker, record) for one company's index fields, or None without a usable ticker"""
+        cik = cik.strip()
+        company_name = company_name.strip()
         
-        print(f"📊 Processed {len(ticker_mapping)} ticker mappings")
-        return ticker_mapping
+        # Extract ticker from company name or filename
+        ticker = self._extract_ticker(company_name, filename)
+        
+        if ticker and len(ticker) <= 5 and ticker.isalpha():
+            return ticker, {
+                'cik': cik if len(cik) >= 10 else cik.zfill(10),  # Pad CIK to 10 digits
+                'name': company_name,
+                'ticker': ticker
+            }
+        return None
     
     def _extract_ticker(self, company_name: str, filename: str) -> Optional[str]:
         """
         Extract ticker symbol from company name or filename
         Uses heuristics to identify likely ticker symbols
         """
-        # Common patterns in company names
-        import re
-        
         # Look for ticker in parentheses: "APPLE INC (AAPL)"
-        match = re.search(r'\(([A-Z]{1,5})\)', company_name)
-        if match:
-            return match.group(1)
+        ticker = _paren_ticker(company_name)
+        if ticker:
+            return ticker
         
         # Look for ticker after company name: "APPLE INC AAPL"
         words = company_name.split()
         for word in reversed(words):
             if len(word) <= 5 and word.isalpha() and word.isupper():
                 # Verify it's not just a common word
-                if word not in ['INC', 'LLC', 'CORP', 'CO', 'LTD']:
+                if word not in TICKER_STOPWORDS:
                     return word
         
         return None
     
     def _save_ticker_mapping(self, ticker_mapping: Dict):
         """Save ticker mapping to compressed file"""
-        with gzip.open(self.ticker_mapping_file, 'wt') as f:
-            json.dump(ticker_mapping, f, separators=(',', ':'))
+        # Level 1 is several times faster than the default 9 and only slightly larger for JSON
+        with _open_gzip(self.ticker_mapping_file, 'wb', compresslevel=1) as f:
+            f.write(_json_dumps({ticker: _pack_record(ticker, record) for ticker, record in ticker_mapping.items()}))
+        self.ticker_count_file.write_text(str(len(ticker_mapping)))
     
     def _mark_update_time(self):
         """Mark the current time as last update"""
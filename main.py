@@ -10,6 +10,17 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def search_filings(ticker, filing_types, start_date, end_date):
+    # Streamlit reruns the script on every widget change; identical searches reuse the cached result
+    scraper = SECFilingScraper()
+    return scraper.get_filings(
+        ticker,
+        list(filing_types),
+        start_date=start_date,
+        end_date=end_date
+    )
+
 def main():
     st.title("SEC Filing Scraper")
     st.markdown("""
@@ -47,12 +58,11 @@ def main():
 
         try:
             with st.spinner("Searching for filings..."):
-                scraper = SECFilingScraper()
-                filings = scraper.get_filings(
+                filings = search_filings(
                     ticker.upper(),
-                    filing_types,
-                    start_date=date_range[0],
-                    end_date=date_range[1]
+                    tuple(filing_types),
+                    date_range[0],
+                    date_range[1]
                 )
 
                 if not filings:
@@ -5,7 +5,7 @@ Enforced with Pydantic for runtime validation and clear error messages
 """
 
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 SchemaVersion = Literal["1.0"]
@@ -47,13 +47,21 @@ class FinancialData(BaseModel):
     periods: Periods
     metadata: Metadata
     
-    class Config:
-        """Pydantic configuration for strict validation"""
-        validate_assignment = True
-        extra = "forbid"  # Reject unknown fields
+    # Pydantic v2 configuration for strict validation; built once per processor
+    # call and never reassigned, so freeze it instead of validating assignments
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",  # Reject unknown fields
+    )
+
+def decode_financial_data(raw) -> FinancialData:
+    """Parse and validate FinancialData JSON (str or bytes) in one pass inside pydantic-core"""
+    return FinancialData.model_validate_json(raw)
 
 def safe_float(value) -> Optional[float]:
     """Helper to safely convert SEC raw data to float"""
+    if isinstance(value, (int, float)):  # already numeric: skip the None/"" checks
+        return float(value)
     try:
         if value is None or value == "":
             return None
@@ -61,6 +69,14 @@ def safe_float(value) -> Optional[float]:
     except (TypeError, ValueError, AttributeError):
         return None
 
+# Exact quarter spellings; anything else falls back to a "Qn" substring search
+QUARTER_ALIASES = {
+    "Q1": "Q1", "1": "Q1", "01": "Q1",
+    "Q2": "Q2", "2": "Q2", "02": "Q2",
+    "Q3": "Q3", "3": "Q3", "03": "Q3",
+    "Q4": "Q4", "4": "Q4", "04": "Q4",
+}
+
 def normalize_quarter(quarter_str) -> Optional[str]:
     """Helper to normalize quarter formats to Q1, Q2, Q3, Q4"""
     if not quarter_str:
@@ -68,24 +84,11 @@ def normalize_quarter(quarter_str) -> Optional[str]:
     
     quarter_str = str(quarter_str).upper().strip()
     
-    # Handle various formats
-    if quarter_str in ["Q1", "Q2", "Q3", "Q4"]:
-        return quarter_str
-    elif quarter_str in ["1", "01"]:
-        return "Q1"
-    elif quarter_str in ["2", "02"]:
-        return "Q2"
-    elif quarter_str in ["3", "03"]:
-        return "Q3"
-    elif quarter_str in ["4", "04"]:
-        return "Q4"
-    elif "Q1" in quarter_str:
-        return "Q1"
-    elif "Q2" in quarter_str:
-        return "Q2"
-    elif "Q3" in quarter_str:
-        return "Q3"
-    elif "Q4" in quarter_str:
-        return "Q4"
+    quarter = QUARTER_ALIASES.get(quarter_str)
+    if quarter:
+        return quarter
+    for quarter in ("Q1", "Q2", "Q3", "Q4"):
+        if quarter in quarter_str:
+            return quarter
     
-    return None
\ No newline at end of file
+    return None
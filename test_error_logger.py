@@ -0,0 +1,29 @@
+import error_logger
+from error_logger import DetailLevel, ErrorCategory, SECFinancialErrorLogger
+
+
+def _messages(logger):
+    return [(record["level"], record["message"]) for record in logger.session_errors]
+
+
+def test_aggregated_repeats_are_counted_escalated_and_flushed_at_exit():
+    logger = SECFinancialErrorLogger("AggregationTest")
+    for attempt in (1, 2, 3):
+        logger.log_network_timeout("http://x", 5.0, attempt, detail_level=DetailLevel.MINIMAL)
+    for _ in range(50):
+        logger.log_sec_api_error("/ep", 500, "boom", detail_level=DetailLevel.MINIMAL)
+
+    assert logger._total_errors == 53
+    assert logger.error_counts[ErrorCategory.NETWORK.value] == 3
+    assert logger.error_counts[ErrorCategory.SEC_API.value] == 50
+
+    error_logger._flush_all_aggregates()
+
+    messages = _messages(logger)
+    assert messages[1] == ("WARNING", "Network Timeout - URL: http://x - Duration: 5.0s - Attempt: 2"
+                                      " - 1 additional occurrence(s) within 1.0s")
+    assert messages[2] == ("ERROR", "Network Timeout - URL: http://x - Duration: 5.0s - Attempt: 3")
+    assert messages[4] == ("CRITICAL", "SEC API Server Error - Endpoint: /ep"
+                                       " - 49 additional occurrence(s) within 1.0s")
+    assert len({record["error_id"] for record in logger.session_errors}) == len(messages) == 5
+    assert logger._total_errors == 53
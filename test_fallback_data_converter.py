@@ -0,0 +1,46 @@
+from fallback_data_converter import convert_fallback_to_raw_data
+
+
+def _periods(count, **overrides):
+    return [dict({'value': 100 + i, 'fiscal_year': 2000 + i}, **overrides) for i in range(count)]
+
+
+def test_explicit_none_is_kept_for_short_and_long_histories():
+    # 31 and 32 periods straddle the size at which a separate batched path used to kick in
+    for count in (3, 31, 32, 64):
+        annual = _periods(count, end_date=None, extraction_method=None)
+        annual[0] = {'value': None, 'fiscal_year': None}
+        quarterly = _periods(count, fiscal_quarter=None, extraction_method=None)
+        quarterly[0] = {'value': None, 'fiscal_year': None, 'fiscal_quarter': None}
+
+        result = convert_fallback_to_raw_data(
+            {'annual_data': [], 'quarterly_data': []},
+            {'annual': annual, 'quarterly': quarterly, 'extraction_method': 'tier'},
+            'TEST',
+        )
+
+        assert result['annual_data'][0] == {
+            'metric': 'Revenues', 'value': None, 'fiscal_year': None,
+            'end_date': 'None-12-31', 'extraction_method': 'fallback', 'source': 'tier',
+        }
+        assert result['annual_data'][1]['end_date'] is None
+        assert result['annual_data'][1]['extraction_method'] is None
+        assert result['quarterly_data'][0] == {
+            'metric': 'Revenues', 'value': None, 'fiscal_year': None, 'fiscal_quarter': None,
+            'end_date': 'None-03-31', 'extraction_method': 'fallback', 'source': 'tier',
+        }
+        assert result['quarterly_data'][1]['fiscal_quarter'] is None
+        assert result['quarterly_data'][1]['end_date'] == '2001-03-31'
+
+
+def test_missing_keys_get_defaults():
+    result = convert_fallback_to_raw_data(
+        {'annual_data': [{'metric': 'Revenues', 'value': 1}, {'metric': 'Assets', 'value': 2}]},
+        {'annual': [{}] * 40},
+        'TEST',
+    )
+    assert result['annual_data'][0] == {'metric': 'Assets', 'value': 2}
+    assert result['annual_data'][1:] == [{
+        'metric': 'Revenues', 'value': 0, 'fiscal_year': None, 'end_date': '2023-12-31',
+        'extraction_method': 'fallback', 'source': 'multi_tier_fallback',
+    }] * 40
@@ -0,0 +1,24 @@
+import pytest
+
+import final_sec_edgar_parser as parser
+
+
+HTML = (
+    "<table><tr><th>Item</th><th>Fiscal\xa02023</th><th>Fiscal 2022 — restated</th></tr>"
+    "<tr><td>Total revenue</td><td>€1,234\xa0</td><td>—</td></tr></table>"
+)
+
+
+@pytest.mark.parametrize("use_lxml", [True, False])
+def test_str_input_keeps_non_ascii_cells(monkeypatch, use_lxml):
+    if use_lxml and parser.etree is None:
+        pytest.skip("lxml is not installed")
+    if not use_lxml:
+        monkeypatch.setattr(parser, "etree", None)
+
+    records = parser.parse_html_financial_table(HTML, ticker="TEST")
+
+    assert [(r["period_header"], r["label"], r["value_raw"]) for r in records] == [
+        ("Fiscal\xa02023", "revenue", "€1,234"),
+        ("Fiscal 2022 — restated", "revenue", "—"),
+    ]